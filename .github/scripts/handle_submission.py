@@ -2,18 +2,22 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import importlib
 import importlib.util
 import inspect
 import io
 import json
+import multiprocessing
 import os
+import queue
 import re
 import sys
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 # Make sure project root is on sys.path for imports during GH Action runs
 THIS_FILE = Path(__file__).resolve()
@@ -28,6 +32,7 @@ class Submission:
     author: str
     body: str
     title: str
+    updated_at: str = ""
 
 
 CODE_FENCE_RE = re.compile(r"```(?:python)?\s*([\s\S]*?)```", re.IGNORECASE)
@@ -37,13 +42,19 @@ SAFE_NAME_RE = re.compile(r"[^a-z0-9_-]+")
 def parse_event(event_path: str) -> Submission:
     with open(event_path, "r", encoding="utf-8") as f:
         data = json.load(f)
+    return parse_event_data(data)
+
+
+def parse_event_data(data: dict) -> Submission:
     issue = data.get("issue") or {}
     user = issue.get("user") or {}
     body = issue.get("body") or ""
     title = issue.get("title") or ""
     number = issue.get("number") or data.get("number") or 0
     author = user.get("login") or "unknown"
-    return Submission(issue_number=int(number), author=str(author), body=str(body), title=str(title))
+    updated_at = issue.get("updated_at") or ""
+    return Submission(issue_number=int(number), author=str(author), body=str(body), title=str(title),
+                      updated_at=str(updated_at))
 
 
 def extract_code(body: str) -> Optional[str]:
@@ -179,12 +190,264 @@ def build_comment(sub: Submission, filename: str, extracted: bool, extract_error
     return buf.getvalue()
 
 
+def code_hash(code: str) -> str:
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+
+def iter_batch_events(batch_path: str) -> Iterator[dict]:
+    """Yield event payloads from a directory of *.json files or a JSONL file."""
+    path = Path(batch_path)
+    if path.is_dir():
+        for file in sorted(path.glob("*.json")):
+            with open(file, "r", encoding="utf-8") as f:
+                yield json.load(f)
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def load_hash_state(state_path: Path) -> Dict[str, dict]:
+    try:
+        return json.loads(state_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _warm_worker() -> None:
+    # Pay the axelrod / engine import once per worker process, not per submission
+    try:
+        import axelrod  # noqa: F401
+        import tournament.engine.validation  # noqa: F401
+    except Exception:
+        pass
+
+
+def validate_written_player(username: str) -> Tuple[Optional[str], List[Tuple[str, List[str]]]]:
+    """Import and validate tournament/players/<username>.py (runs in a worker process).
+
+    Anything the submission raises at import time, including SystemExit, is
+    reported as an import error instead of escaping the worker.
+    """
+    importlib.invalidate_caches()
+    player_path = PROJECT_ROOT / "tournament" / "players" / f"{username}.py"
+    try:
+        module, import_error = import_written_module(player_path)
+        per_class: List[Tuple[str, List[str]]] = []
+        if module is not None and import_error is None:
+            per_class = validate_classes(find_player_classes(module))
+    except BaseException as e:
+        return f"Import error for tournament.players.{username}: {type(e).__name__}: {e}", []
+    return import_error, per_class
+
+
+def submission_passed(import_error: Optional[str], per_class: List[Tuple[str, List[str]]]) -> bool:
+    return import_error is None and any(not errs for _, errs in per_class)
+
+
+def build_superseded_comment(sub: Submission, newer: Submission) -> str:
+    buf = io.StringIO()
+    print(f"### Player Submission Validation for @{sub.author}", file=buf)
+    print("", file=buf)
+    print(f"- Issue: #{sub.issue_number}", file=buf)
+    print("", file=buf)
+    print(f"⏭️ Superseded by #{newer.issue_number}: only the latest submission from each author is validated.",
+          file=buf)
+    return buf.getvalue()
+
+
+def build_unchanged_comment(sub: Submission, filename: str, previous: dict) -> str:
+    buf = io.StringIO()
+    print(f"### Player Submission Validation for @{sub.author}", file=buf)
+    print("", file=buf)
+    print(f"- Issue: #{sub.issue_number}", file=buf)
+    print(f"- Saved to: `tournament/players/{filename}`", file=buf)
+    print("", file=buf)
+    print("ℹ️ Your code is unchanged since it was last validated, so it was not re-run.", file=buf)
+    print("", file=buf)
+    status = previous.get("status")
+    where = f" (issue #{previous['issue']})" if previous.get("issue") is not None else ""
+    if status == "pass":
+        print(f"### ✅ Previous result: PASS{where}", file=buf)
+    elif status == "fail":
+        print(f"### ❌ Previous result: FAIL{where}", file=buf)
+        print("Please address the issues reported earlier and edit the issue to re-run.", file=buf)
+    else:
+        print(f"Previous result: {status or 'unknown'}{where}", file=buf)
+    return buf.getvalue()
+
+
+def _validate_to_queue(username: str, results_queue) -> None:
+    results_queue.put((username, validate_written_player(username)))
+
+
+def validate_in_workers(usernames: List[str], *, workers: Optional[int] = None,
+                        timeout: float = 60.0) -> Dict[str, Tuple[Optional[str], List[Tuple[str, List[str]]]]]:
+    """Validate each user's written player file in its own worker process.
+
+    At most `workers` processes run at once. A submission that kills its
+    process or runs longer than `timeout` seconds only fails that user; hung
+    processes are terminated. Heavy imports are done here first so forked
+    workers start warm.
+    """
+    _warm_worker()
+    limit = workers or os.cpu_count() or 1
+    results_queue = multiprocessing.Queue()
+    waiting = list(usernames)
+    running: Dict[str, Tuple[multiprocessing.Process, float]] = {}
+    results: Dict[str, Tuple[Optional[str], List[Tuple[str, List[str]]]]] = {}
+
+    def drain(wait: float) -> None:
+        try:
+            while True:
+                username, result = results_queue.get(timeout=wait)
+                results[username] = result
+                wait = 0.0
+        except queue.Empty:
+            pass
+
+    while waiting or running:
+        while waiting and len(running) < limit:
+            username = waiting.pop(0)
+            proc = multiprocessing.Process(target=_validate_to_queue, args=(username, results_queue), daemon=True)
+            proc.start()
+            running[username] = (proc, time.monotonic())
+        drain(0.05)
+        for username, (proc, started) in list(running.items()):
+            if username in results:
+                proc.join()
+            elif not proc.is_alive():
+                # The result may still be in flight; give it a moment before declaring a crash
+                drain(0.5)
+                if username not in results:
+                    results[username] = (f"Validation crashed (worker exit code {proc.exitcode})", [])
+            elif time.monotonic() - started > timeout:
+                proc.terminate()
+                proc.join()
+                results[username] = (f"Validation timed out after {timeout:g}s "
+                                     "(does the module run code at import time?)", [])
+            else:
+                continue
+            del running[username]
+    return results
+
+
+def run_batch(batch_path: str, out_dir: Path, state_path: Path, *, workers: Optional[int] = None,
+              rebuild_registry: bool = True, timeout: float = 60.0) -> int:
+    """Process many issue events: dedupe, validate in parallel, rebuild the registry once.
+
+    Only the newest event per author (by `issue.updated_at`, then issue
+    number) is processed, since each author has a single player file; older
+    ones get a "superseded" comment. Submissions whose extracted code hash
+    matches the stored state are not re-validated; their comment repeats the
+    previous result. Files of failing submissions are
+    restored to their previous content (or removed) so the rebuilt registry
+    only picks up passing players.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    state = load_hash_state(state_path)
+
+    events = [parse_event_data(data) for data in iter_batch_events(batch_path)]
+    events.sort(key=lambda s: (s.updated_at, s.issue_number))
+    latest: Dict[str, Submission] = {}
+    for sub in events:
+        latest[sanitize_username(sub.author)] = sub
+
+    summary: List[dict] = []
+    latest_issues = {sub.issue_number for sub in latest.values()}
+    for sub in events:
+        newer = latest[sanitize_username(sub.author)]
+        # Several edit events of the same issue share one comment, written for the newest
+        if sub is newer or sub.issue_number in latest_issues:
+            continue
+        comment_path = out_dir / f"comment-{sub.issue_number}.md"
+        comment_path.write_text(build_superseded_comment(sub, newer), encoding="utf-8")
+        summary.append({"issue": sub.issue_number, "author": sub.author, "status": "superseded",
+                        "superseded_by": newer.issue_number, "comment": str(comment_path)})
+
+    pending: List[Tuple[str, Submission, str, Optional[str]]] = []
+    for username, sub in latest.items():
+        filename = f"{username}.py"
+        comment_path = out_dir / f"comment-{sub.issue_number}.md"
+        code = extract_code(sub.body)
+        if code is None or code.strip() == "":
+            comment_path.write_text(build_comment(sub, filename, False, "No code block found.", None, []),
+                                    encoding="utf-8")
+            summary.append({"issue": sub.issue_number, "author": sub.author, "status": "no-code",
+                            "comment": str(comment_path)})
+            continue
+        digest = code_hash(code)
+        if state.get(username, {}).get("hash") == digest:
+            print(f"{username}: unchanged since last run, skipping")
+            comment_path.write_text(build_unchanged_comment(sub, filename, state[username]), encoding="utf-8")
+            summary.append({"issue": sub.issue_number, "author": sub.author, "status": "skipped",
+                            "previous": state[username].get("status"), "comment": str(comment_path)})
+            continue
+        player_path = PROJECT_ROOT / "tournament" / "players" / filename
+        previous = player_path.read_text(encoding="utf-8") if player_path.exists() else None
+        write_player_file(username, code)
+        pending.append((username, sub, digest, previous))
+
+    any_pass = False
+    if pending:
+        results = validate_in_workers([username for username, _, _, _ in pending], workers=workers, timeout=timeout)
+        for username, sub, digest, previous in pending:
+            import_error, per_class = results[username]
+            filename = f"{username}.py"
+            comment_path = out_dir / f"comment-{sub.issue_number}.md"
+            comment_path.write_text(build_comment(sub, filename, True, None, import_error, per_class),
+                                    encoding="utf-8")
+            passed = submission_passed(import_error, per_class)
+            any_pass = any_pass or passed
+            status = "pass" if passed else "fail"
+            print(f"{username}: {status.upper()}")
+            if not passed:
+                player_path = PROJECT_ROOT / "tournament" / "players" / filename
+                if previous is None:
+                    player_path.unlink(missing_ok=True)
+                else:
+                    player_path.write_text(previous, encoding="utf-8")
+            state[username] = {"hash": digest, "issue": sub.issue_number, "status": status}
+            summary.append({"issue": sub.issue_number, "author": sub.author, "status": status,
+                            "comment": str(comment_path)})
+
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    state_path.write_text(json.dumps(state, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    (out_dir / "summary.json").write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+
+    if rebuild_registry and any_pass:
+        importlib.invalidate_caches()
+        from tournament.scripts.build_registry import main as build_registry_main
+        build_registry_main(["--verbose"])
+
+    return 0
+
+
 def main(argv: List[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Handle player submission from issue")
-    parser.add_argument("--event", required=True, help="Path to GitHub event JSON")
-    parser.add_argument("--out-comment", required=True, help="Path to write markdown comment")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--event", help="Path to GitHub event JSON")
+    source.add_argument("--batch", help="Directory of event JSON files, or a JSONL file with one event per line")
+    parser.add_argument("--out-comment", help="Path to write markdown comment (with --event)")
+    parser.add_argument("--out-dir", default="submission-comments",
+                        help="Directory for comment-<issue>.md files and summary.json (with --batch)")
+    parser.add_argument("--state", default=None,
+                        help="JSON file of code hashes from previous batches (default: <out-dir>/hashes.json)")
+    parser.add_argument("--workers", type=int, default=None, help="Validation worker processes (with --batch)")
+    parser.add_argument("--timeout", type=float, default=60.0,
+                        help="Seconds to wait for each submission's validation (with --batch)")
+    parser.add_argument("--no-registry", action="store_true", help="Skip the registry rebuild (with --batch)")
     args = parser.parse_args(argv)
 
+    if args.batch:
+        out_dir = Path(args.out_dir)
+        state_path = Path(args.state) if args.state else out_dir / "hashes.json"
+        return run_batch(args.batch, out_dir, state_path, workers=args.workers,
+                         rebuild_registry=not args.no_registry, timeout=args.timeout)
+    if not args.out_comment:
+        parser.error("--out-comment is required with --event")
+
     sub = parse_event(args.event)
 
     code = extract_code(sub.body)
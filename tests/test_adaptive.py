@@ -0,0 +1,45 @@
+"""Adaptive repetitions: argument checks, budget and stop reasons."""
+import pytest
+
+axl = pytest.importorskip("axelrod")
+
+from tournament.engine.adaptive import run_adaptive_round_robin
+from tournament.players.random_player import Random
+
+DETERMINISTIC = [axl.Cooperator, axl.Defector, axl.TitForTat, axl.Grudger]
+# Two coin-flipping players whose order stays uncertain for a long time
+NOISY = [axl.Cooperator, axl.Defector, axl.Random, Random]
+
+
+@pytest.mark.parametrize("options", [
+    {"initial_repetitions": 1},
+    {"initial_repetitions": 3, "max_repetitions": 2},
+    {"initial_repetitions": 3, "budget": 3 * 6 - 1},
+])
+def test_invalid_arguments_are_rejected(options):
+    with pytest.raises(ValueError):
+        run_adaptive_round_robin(DETERMINISTIC, turns=10, seed=1, **options)
+
+
+def test_deterministic_field_needs_only_initial_repetitions():
+    result = run_adaptive_round_robin(DETERMINISTIC, turns=20, seed=1, initial_repetitions=2, max_repetitions=10)
+    assert result.stop_reason == "all adjacent ranks resolved"
+    assert result.simulated == 6 * 2
+    assert result.saved == 6 * 10 - result.simulated
+
+
+def test_budget_is_honoured():
+    budget = 6 * 2 + 5
+    result = run_adaptive_round_robin(
+        NOISY, turns=20, seed=1, initial_repetitions=2, max_repetitions=1000, confidence=0.999999, budget=budget
+    )
+    assert result.stop_reason == "budget exhausted"
+    assert result.simulated <= budget
+
+
+def test_repetition_cap_is_reported():
+    result = run_adaptive_round_robin(
+        NOISY, turns=20, seed=1, initial_repetitions=2, max_repetitions=3, confidence=0.999999
+    )
+    assert result.stop_reason == "repetition cap reached with ranks still unresolved"
+    assert max(result.repetitions.values()) == 3
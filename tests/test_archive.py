@@ -0,0 +1,57 @@
+"""Move archive: write/read round trip, aliases and bulk analytics."""
+from tournament.engine.archive import MoveArchive, MoveArchiveWriter, pack_moves, unpack_moves
+
+
+def _pairs(a: str, b: str):
+    return list(zip(a, b))
+
+
+def test_pack_round_trip():
+    moves = "CDDCCCCCDDC"
+    assert unpack_moves(pack_moves(moves), len(moves)) == moves
+
+
+def test_write_read_round_trip_with_aliases(tmp_path):
+    with MoveArchiveWriter(tmp_path) as writer:
+        writer.append("TitForTat", "Defector", _pairs("CDDD", "DDDD"))
+        writer.append("TitForTat", "Cooperator", _pairs("CCCC", "CCCC"), repetition=1)
+        # Copycats behave like TitForTat; the source pair may name the stored match in either order
+        writer.alias(("TitForTat", "Defector"), "Copycat", "Defector")
+        writer.alias(("Defector", "TitForTat"), "Defector", "Copycat2")
+        assert len(writer.written_keys()) == 4
+
+    with MoveArchive(tmp_path) as archive:
+        assert len(archive) == 4
+        assert archive.moves("TitForTat", "Defector") == ("CDDD", "DDDD")
+        # Either orientation can be requested
+        assert archive.moves("Defector", "TitForTat") == ("DDDD", "CDDD")
+        assert archive.moves("Copycat", "Defector") == ("CDDD", "DDDD")
+        assert archive.moves("Defector", "Copycat2") == ("DDDD", "CDDD")
+        assert archive.moves("TitForTat", "Cooperator", 1) == ("CCCC", "CCCC")
+        assert archive.first_defection("TitForTat", "Defector") == (1, 0)
+        assert archive.first_defection("Cooperator", "TitForTat", 1) == (None, None)
+        bits_a, bits_b, turns = archive.raw("TitForTat", "Defector")
+        assert (bytes(bits_a), bytes(bits_b), turns) == (pack_moves("CDDD"), pack_moves("DDDD"), 4)
+        bits_a.release()
+        bits_b.release()
+
+        rates = archive.cooperation_rates()
+        assert rates == {
+            "Cooperator": 1.0,
+            "Copycat": 0.25,
+            "Copycat2": 0.25,
+            "Defector": 0.0,
+            "TitForTat": 5 / 8,
+        }
+        assert archive.cooperation_by_turn("TitForTat") == [1.0, 0.5, 0.5, 0.5]
+
+
+def test_cooperation_rates_limited_to_given_keys(tmp_path):
+    with MoveArchiveWriter(tmp_path) as writer:
+        writer.append("A", "B", _pairs("DDDD", "CCCC"))
+    with MoveArchiveWriter(tmp_path) as writer:
+        writer.append("A", "C", _pairs("CCCC", "CCDD"))
+        keys = writer.written_keys()
+    with MoveArchive(tmp_path) as archive:
+        assert archive.cooperation_rates(keys) == {"A": 1.0, "C": 0.5}
+        assert archive.cooperation_rates()["A"] == 0.5
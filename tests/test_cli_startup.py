@@ -0,0 +1,20 @@
+"""Startup tracking for the `tournament` CLI: light commands must stay lazy."""
+import pytest
+
+from tournament.scripts import bench
+
+# Import time a light command may spend (`-X importtime`, top-level modules).
+# Light commands take well under 150 ms here; importing axelrod alone costs
+# around a second, so this catches an eager heavy import even on slow runners.
+IMPORT_BUDGET_MS = 400
+
+
+@pytest.mark.parametrize("command", bench.LIGHT_COMMANDS, ids=lambda c: " ".join(c))
+def test_light_command_is_lazy(command, record_property):
+    sample = bench.measure(command, repeat=3)
+    assert sample.returncode == 0, sample.error
+    # Recorded in the JUnit XML (`pytest --junitxml`) so startup can be tracked over time
+    record_property("import_ms", round(sample.import_ms, 1))
+    record_property("wall_ms", round(sample.wall_ms, 1))
+    assert sample.heavy_imports() == []
+    assert sample.import_ms <= IMPORT_BUDGET_MS, f"{sample.import_ms:.1f} ms of imports"
@@ -0,0 +1,60 @@
+"""Evaluation server: a real /evaluate round trip through the HTTP handler."""
+import json
+import threading
+from http.server import HTTPServer
+
+import pytest
+
+pytest.importorskip("axelrod")
+
+from tournament.scripts.eval_server import Evaluator, evaluate_candidate, make_handler
+
+CANDIDATE = '''
+class Mirror(Player):
+    name = "Mirror"
+
+    def strategy(self, opponent):
+        return opponent.history[-1] if opponent.history else Action.C
+'''
+
+EXITS = '''
+import sys
+sys.exit(3)
+'''
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    evaluator = Evaluator(turns=20, seed=1, workers=2, timeout=30)
+    server = HTTPServer(("127.0.0.1", 0), make_handler(evaluator))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", evaluator
+    finally:
+        server.shutdown()
+        server.server_close()
+        evaluator.close()
+
+
+def test_evaluate_result_is_json_serialisable(server_url):
+    _, evaluator = server_url
+    result = evaluator.evaluate(CANDIDATE)
+    assert json.loads(json.dumps(result))["player"] == "Mirror"
+    assert all(type(total) is int for _, total in result["ranking"])
+
+
+def test_evaluate_round_trip(server_url):
+    url, evaluator = server_url
+    result = evaluate_candidate(CANDIDATE, url=url)
+    assert result["player"] == "Mirror"
+    assert result["of"] == len(evaluator.names) + 1
+    assert [name for name, _ in result["ranking"]][result["rank"] - 1] == "Mirror"
+    assert {opp for opp, _, _ in result["matches"]} == set(evaluator.names)
+
+
+def test_failing_candidate_does_not_stop_the_server(server_url):
+    url, _ = server_url
+    with pytest.raises(RuntimeError, match="SystemExit"):
+        evaluate_candidate(EXITS, url=url)
+    assert evaluate_candidate(CANDIDATE, url=url)["player"] == "Mirror"
@@ -0,0 +1,43 @@
+"""Sub-quadratic formats: pairing coverage and runs on a tiny field."""
+import random
+
+import pytest
+
+from tournament.engine import formats
+
+
+@pytest.mark.parametrize("n, k", [(5, 1), (7, 1), (7, 3), (8, 1), (9, 4)])
+def test_sample_pairings_gives_every_player_a_match(n, k):
+    for seed in range(20):
+        pairs = formats.sample_pairings(n, k, random.Random(seed))
+        assert {i for pair in pairs for i in pair} == set(range(n))
+        assert all(i < j for i, j in pairs)
+
+
+def _tiny_field():
+    axl = pytest.importorskip("axelrod")
+    return [axl.Cooperator, axl.Defector, axl.TitForTat, axl.Grudger, axl.Alternator]
+
+
+@pytest.mark.parametrize("run_format, options", [
+    (formats.run_swiss, {}),
+    (formats.run_sampled_round_robin, {"k": 1}),
+    (formats.run_group_stage, {"group_size": 2, "advance": 1}),
+])
+def test_format_runs_on_a_tiny_field(run_format, options):
+    players = _tiny_field()
+    result = run_format(players, turns=20, seed=1, **options)
+    names = {cls.__name__ for cls in players}
+    assert set(result.totals) == names
+    assert {name for name, _ in result.ranking()} == names
+    # Every total is an estimate from at least one played match
+    assert {name for m in result.matches for name in (m.a, m.b)} == names
+
+
+def test_scale_format_options_keeps_group_shape():
+    scaled = formats.scale_format_options({"group_size": 8, "advance": 2}, 500, 24)
+    assert scaled == {"group_size": 8, "advance": 2}
+    # Capped so a subset still forms at least two groups
+    assert formats.scale_format_options({"group_size": 40, "advance": 40}, 500, 24) == {"group_size": 12, "advance": 11}
+    assert formats.scale_format_options({"k": 50}, 500, 24) == {"k": 2}
+    assert formats.scale_format_options({"k": 50}, 20, 24) == {"k": 50}
@@ -0,0 +1,85 @@
+"""Results store: adding runs and building every report from the index."""
+import json
+
+import pytest
+
+from tournament.engine import results
+from tournament.engine.tournament import MatchResult, TournamentResult
+
+
+def _result(scores):
+    """TournamentResult from {(a, b): (score_a, score_b)}."""
+    matches = [MatchResult(a, b, sa, sb) for (a, b), (sa, sb) in scores.items()]
+    totals = {}
+    for m in matches:
+        totals[m.a] = totals.get(m.a, 0) + m.score_a
+        totals[m.b] = totals.get(m.b, 0) + m.score_b
+    return TournamentResult(players=list(totals), totals=totals, matches=matches)
+
+
+FIRST = {("Cooperator", "Defector"): (0, 50), ("Cooperator", "TitForTat"): (30, 30), ("Defector", "TitForTat"): (14, 9)}
+SECOND = {("Cooperator", "Defector"): (0, 50), ("Cooperator", "TitForTat"): (30, 30), ("Defector", "TitForTat"): (5, 40)}
+PARAMS = {"format": "round-robin", "turns": 10, "players": 3}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = results.ResultStore(tmp_path)
+    store.add_run(_result(FIRST), params=dict(PARAMS, seed=1), cooperation={"Cooperator": 1.0})
+    store.add_run(_result(SECOND), params=dict(PARAMS, seed=2))
+    return store
+
+
+def test_add_run_writes_matches_and_index(store, tmp_path):
+    run_files = sorted((tmp_path / results.RUNS_DIR).iterdir())
+    assert [p.suffix for p in run_files] == [".jsonl", ".jsonl"]
+    lines = run_files[0].read_text(encoding="utf-8").splitlines()
+    assert json.loads(lines[0]) == {"a": "Cooperator", "b": "Defector", "score_a": 0, "score_b": 50}
+
+    reopened = results.ResultStore(tmp_path)
+    assert len(reopened.index["runs"]) == 2
+    name, aggregates = reopened.series()
+    assert name == results.series_key(PARAMS)
+    assert aggregates["players"]["Defector"] == {"runs": 2, "total": 119, "matches": 4, "best_rank": 1}
+    assert aggregates["head_to_head"]["TitForTat"]["Defector"] == [49, 19, 2]
+
+
+@pytest.mark.parametrize("fmt", ["md", "html"])
+def test_every_report_renders(store, fmt):
+    assert "Defector" in results.leaderboard(store, fmt=fmt)
+    assert "TitForTat" in results.diff(store, fmt=fmt)
+    assert "Cooperator" in results.standings(store, fmt=fmt)
+    assert "Defector" in results.head_to_head(store, "TitForTat", fmt=fmt)
+    assert "TitForTat" in results.history(store, "TitForTat", fmt=fmt)
+
+
+def test_reports_compare_within_a_series(store):
+    # TitForTat overtook Defector between the two runs of the series
+    board = results.leaderboard(store)
+    assert "| 1 | TitForTat | 70 | +1 |" in board
+    assert "| 2 | Defector | 55 | -1 |" in board
+    store.add_run(_result(FIRST), params=dict(PARAMS, turns=20, seed=1))
+    # A run with different parameters starts its own series: nothing to compare against
+    assert "| 1 | Defector | 64 |  |" in results.leaderboard(store)
+    with pytest.raises(KeyError):
+        results.diff(store)
+    with pytest.raises(KeyError):
+        results.head_to_head(store, "Nobody")
+
+
+def test_round_robin_result_can_be_stored(tmp_path):
+    axl = pytest.importorskip("axelrod")
+    from tournament.engine.tournament import run_round_robin
+
+    result = run_round_robin([axl.Cooperator, axl.Defector, axl.TitForTat], turns=10, seed=1)
+    store = results.ResultStore(tmp_path)
+    run_id = store.add_run(result, params={"format": "round-robin", "turns": 10, "seed": 1})
+    assert store.run(run_id)["totals"] == result.totals
+    assert not list((tmp_path / results.RUNS_DIR).glob("*.tmp"))
+
+
+def test_series_separates_field_sizes_and_format_options():
+    base = {"format": "sampled", "turns": 200, "players": 30, "k": 5}
+    assert results.series_key(dict(base, seed=1)) == results.series_key(dict(base, seed=2))
+    assert results.series_key(base) != results.series_key(dict(base, players=31))
+    assert results.series_key(base) != results.series_key(dict(base, k=6))
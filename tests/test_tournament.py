@@ -0,0 +1,33 @@
+"""Round-robin behaviour: seeded reproducibility and deduplicated results."""
+import pytest
+
+axl = pytest.importorskip("axelrod")
+
+from tournament.engine.tournament import run_round_robin
+from tournament.players.random_player import Random
+
+
+def test_seeded_round_robin_is_reproducible():
+    # Random draws from the global `random` module rather than Axelrod's RNG
+    players = [axl.Cooperator, axl.Defector, Random]
+    first = run_round_robin(players, turns=50, seed=7)
+    second = run_round_robin(players, turns=50, seed=7)
+    assert first.totals == second.totals
+
+
+class Copycat(axl.TitForTat):
+    """Behaves exactly like TitForTat under another name."""
+
+
+class Pushover(axl.Cooperator):
+    """Behaves exactly like Cooperator under another name."""
+
+
+def test_dedupe_totals_match_plain_round_robin():
+    players = [axl.Cooperator, Pushover, axl.TitForTat, Copycat, axl.Defector, axl.Grudger, Random]
+    plain = run_round_robin(players, turns=30, seed=3)
+    deduped = run_round_robin(players, turns=30, seed=3, dedupe=True)
+    assert deduped.totals == plain.totals
+    assert [Copycat.__name__, axl.TitForTat.__name__] in [sorted(c) for c in deduped.duplicates]
+    assert deduped.simulated < len(plain.matches)
+    assert deduped.probe_matches == 16 * len(players)
@@ -4,10 +4,12 @@ Modules:
 - engine: Core tournament logic (validation, referee helpers, round-robin harness)
 - players: Participant strategy submissions and registry
 - scripts: CLI utilities to validate and run tournaments
+- cli: `tournament` command dispatching to the scripts with deferred imports
 """
 
 __all__ = [
     "engine",
     "players",
     "scripts",
+    "cli",
 ]
@@ -0,0 +1,69 @@
+"""Unified `tournament` command line entry point.
+
+Usage:
+    tournament <command> [options]
+
+Each subcommand maps to a module under `tournament.scripts` which is imported
+only when that command runs. Heavy dependencies (`axelrod` and the student
+player modules behind the registry) are imported inside the commands that
+actually need them, so `--help`, `list` and `status` start quickly.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+from typing import Dict, List, Tuple
+
+# command -> (module providing `main(argv)`, one-line help)
+COMMANDS: Dict[str, Tuple[str, str]] = {
+    "run": ("tournament.scripts.run_tournament", "Run a tournament among registered players"),
+    "validate": ("tournament.scripts.validate_player", "Validate one player class or all registered players"),
+    "build-registry": ("tournament.scripts.build_registry", "Rebuild the players registry"),
+    "watch": ("tournament.scripts.watch_players", "Watch the players directory and re-validate on change"),
+    "bench": ("tournament.scripts.bench", "Measure CLI startup time and import cost"),
+    "report": ("tournament.scripts.report", "Leaderboards, diffs and breakdowns from stored results"),
+    "fingerprint": ("tournament.scripts.fingerprint_players", "Report clusters of duplicate players"),
+    "serve": ("tournament.scripts.eval_server", "Serve warm candidate evaluations against the field"),
+    "archive": ("tournament.scripts.archive_info", "Inspect an archive of per-turn match moves"),
+    "list": ("tournament.scripts.registry_status", "List registered players from registry metadata"),
+    "status": ("tournament.scripts.registry_status", "Show registry freshness against the players directory"),
+}
+
+# Commands sharing a module receive their own name as the first argument.
+_SHARED_MODULE_COMMANDS = {"list", "status"}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="tournament",
+        description="Prisoner's Dilemma class tournament tools",
+    )
+    sub = parser.add_subparsers(dest="command", metavar="<command>")
+    for name, (_, help_text) in COMMANDS.items():
+        # Options are parsed by the command module itself
+        sub.add_parser(name, help=help_text, add_help=False)
+    return parser
+
+
+def main(argv: List[str] | None = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    parser = build_parser()
+    if not argv or argv[0] not in COMMANDS:
+        # Let argparse produce the usage / help / unknown command message
+        parser.parse_args(argv[:1])
+        parser.print_help()
+        return 2
+
+    command, rest = argv[0], argv[1:]
+    module_name, _ = COMMANDS[command]
+    if command in _SHARED_MODULE_COMMANDS:
+        rest = [command] + rest
+    # Show `tournament <command>` in the command's own usage messages
+    sys.argv[0] = f"tournament {command}"
+    module = importlib.import_module(module_name)
+    return int(module.main(rest) or 0)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
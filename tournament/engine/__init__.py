@@ -1,7 +1,12 @@
-"""Core tournament engine components: validation, referee, and tournament harness."""
+"""Core tournament engine components: validation, referee, fingerprinting, tournament harness, formats, adaptive repetitions, move archive and stored results."""
 
 __all__ = [
     "validation",
     "referee",
+    "fingerprint",
+    "formats",
+    "adaptive",
+    "archive",
+    "results",
     "tournament",
 ]
@@ -0,0 +1,214 @@
+"""Adaptive repetitions for round-robin tournaments.
+
+`run_round_robin` plays each pairing once, and a fixed number of repetitions
+spends most of its simulation on deterministic pairings whose result never
+changes. `run_adaptive_round_robin` starts every pairing with a few
+repetitions, then spends further repetitions only on stochastic pairings that
+involve players in adjacent ranks whose order is still uncertain.
+
+Each player's total is the sum of their mean score per pairing. Two adjacent
+players count as resolved once the gap between their totals is `z` standard
+errors wide, where `z` is the one-sided normal quantile of `confidence`
+(shared pairings are accounted for; pairings are treated as independent).
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Type
+
+from .referee import play_match
+from .tournament import MatchResult, TournamentResult
+
+
+@dataclass
+class AdaptiveResult(TournamentResult):
+    # Unrounded totals (sum of mean scores per pairing); ranking uses these
+    mean_totals: Dict[str, float] = field(default_factory=dict)
+    repetitions: Dict[Tuple[str, str], int] = field(default_factory=dict)
+    # Confidence that each adjacent pair in the ranking is correctly ordered
+    adjacent_confidence: List[float] = field(default_factory=list)
+    fixed_cost: int = 0
+    stop_reason: str = ""
+
+    def ranking(self) -> List[Tuple[str, int]]:
+        ordered = sorted(self.mean_totals, key=lambda name: self.mean_totals[name], reverse=True)
+        return [(name, self.totals[name]) for name in ordered]
+
+    @property
+    def saved(self) -> int:
+        """Matches saved against playing every pairing `max_repetitions` times."""
+        return self.fixed_cost - self.simulated
+
+
+class _Pairing:
+    """Repetition scores for one pairing (i < j)."""
+
+    def __init__(self) -> None:
+        self.a: List[int] = []
+        self.b: List[int] = []
+
+    @property
+    def reps(self) -> int:
+        return len(self.a)
+
+    @property
+    def stochastic(self) -> bool:
+        return len(set(zip(self.a, self.b))) > 1
+
+    def mean(self, side: int) -> float:
+        scores = self.a if side == 0 else self.b
+        return sum(scores) / len(scores)
+
+    def var(self, side: int) -> float:
+        return _var_of_mean(self.a if side == 0 else self.b)
+
+    def var_diff(self) -> float:
+        return _var_of_mean([x - y for x, y in zip(self.a, self.b)])
+
+
+def _var_of_mean(values: Sequence[float]) -> float:
+    """Sample variance of the mean of `values`."""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    mu = sum(values) / n
+    return sum((v - mu) ** 2 for v in values) / (n - 1) / n
+
+
+def _rep_seed(seed: Optional[int], rep: int) -> Optional[int]:
+    return None if seed is None else seed + rep
+
+
+def run_adaptive_round_robin(
+    player_classes: Sequence[Type],
+    *,
+    turns: int = 200,
+    seed: Optional[int] = None,
+    initial_repetitions: int = 3,
+    max_repetitions: int = 50,
+    confidence: float = 0.95,
+    budget: Optional[int] = None,
+    archive: Optional[Any] = None,
+) -> AdaptiveResult:
+    """Run a round robin with repetitions allocated to uncertain rankings.
+
+    Every pairing first plays `initial_repetitions` times (repetition r uses
+    `seed + r`). Pairings that gave the same result every time are treated as
+    deterministic and never replayed. After that, each step finds the adjacent
+    ranks that are not yet resolved at `confidence`. It then plays one more
+    repetition of every stochastic pairing involving those players, capped at
+    `max_repetitions` per pairing. Stops when every adjacent pair is resolved,
+    no useful repetition is left, or `budget` total matches have been played.
+    With `archive`, each repetition's moves are stored under its repetition number.
+
+    Raises ValueError if `initial_repetitions` < 2 (variance needs two samples),
+    if `max_repetitions` < `initial_repetitions`, or if `budget` cannot cover
+    the initial repetitions of every pairing.
+    """
+    if initial_repetitions < 2:
+        raise ValueError("initial_repetitions must be at least 2 to detect stochastic pairings")
+    if max_repetitions < initial_repetitions:
+        raise ValueError("max_repetitions must be at least initial_repetitions")
+
+    names = [cls.__name__ for cls in player_classes]
+    n = len(player_classes)
+    pairings: Dict[Tuple[int, int], _Pairing] = {
+        (i, j): _Pairing() for i in range(n) for j in range(i + 1, n)
+    }
+    initial_cost = len(pairings) * initial_repetitions
+    if budget is not None and budget < initial_cost:
+        raise ValueError(
+            f"budget of {budget} matches cannot cover {initial_repetitions} initial repetitions "
+            f"of {len(pairings)} pairings ({initial_cost} matches)"
+        )
+    simulated = 0
+
+    def play(key: Tuple[int, int]) -> None:
+        nonlocal simulated
+        p = pairings[key]
+        score_a, score_b = play_match(
+            player_classes[key[0]], player_classes[key[1]],
+            turns=turns, seed=_rep_seed(seed, p.reps), archive=archive, repetition=p.reps,
+        )
+        p.a.append(score_a)
+        p.b.append(score_b)
+        simulated += 1
+
+    def total(i: int) -> float:
+        return sum(pairings[(min(i, k), max(i, k))].mean(0 if i < k else 1) for k in range(n) if k != i)
+
+    def diff_var(i: int, j: int) -> float:
+        """Variance of total(i) - total(j); their shared pairing counts once."""
+        v = 0.0
+        for k in range(n):
+            if k not in (i, j):
+                v += pairings[(min(i, k), max(i, k))].var(0 if i < k else 1)
+                v += pairings[(min(j, k), max(j, k))].var(0 if j < k else 1)
+        return v + pairings[(min(i, j), max(i, j))].var_diff()
+
+    def adjacent() -> Tuple[List[int], List[float]]:
+        totals = [total(i) for i in range(n)]
+        order = sorted(range(n), key=lambda i: totals[i], reverse=True)
+        conf: List[float] = []
+        for upper, lower in zip(order, order[1:]):
+            v = diff_var(upper, lower)
+            gap = totals[upper] - totals[lower]
+            conf.append(1.0 if v == 0 else NormalDist().cdf(gap / math.sqrt(v)))
+        return order, conf
+
+    for key in pairings:
+        for _ in range(initial_repetitions):
+            play(key)
+
+    stop_reason = "all adjacent ranks resolved"
+    while True:
+        order, conf = adjacent()
+        unresolved: Set[int] = set()
+        for pos, c in enumerate(conf):
+            if c < confidence:
+                unresolved.update((order[pos], order[pos + 1]))
+        if not unresolved:
+            break
+        relevant = [
+            key for key, p in pairings.items()
+            if (key[0] in unresolved or key[1] in unresolved) and p.stochastic
+        ]
+        candidates = [key for key in relevant if pairings[key].reps < max_repetitions]
+        if not candidates:
+            if relevant:
+                stop_reason = "repetition cap reached with ranks still unresolved"
+            else:
+                stop_reason = "no pairing left that can change the ranking"
+            break
+        if budget is not None and simulated + len(candidates) > budget:
+            # Spend what is left on the noisiest pairings
+            candidates.sort(key=lambda key: pairings[key].var_diff(), reverse=True)
+            candidates = candidates[:max(0, budget - simulated)]
+            for key in candidates:
+                play(key)
+            stop_reason = "budget exhausted"
+            order, conf = adjacent()
+            break
+        for key in candidates:
+            play(key)
+
+    mean_totals = {names[i]: total(i) for i in range(n)}
+    matches: List[MatchResult] = []
+    repetitions: Dict[Tuple[str, str], int] = {}
+    for (i, j), p in pairings.items():
+        matches.append(MatchResult(names[i], names[j], round(p.mean(0)), round(p.mean(1))))
+        repetitions[(names[i], names[j])] = p.reps
+
+    return AdaptiveResult(
+        players=names,
+        totals={name: round(t) for name, t in mean_totals.items()},
+        matches=matches,
+        simulated=simulated,
+        mean_totals=mean_totals,
+        repetitions=repetitions,
+        adjacent_confidence=conf,
+        fixed_cost=len(pairings) * max_repetitions,
+        stop_reason=stop_reason,
+    )
@@ -0,0 +1,267 @@
+"""Append-only, bit-packed archive of per-turn match moves.
+
+An archive is a directory with two files:
+
+- `moves.bin`: raw data. Each match stores the two players' moves as two
+  bit strings of ceil(turns / 8) bytes (bit set = defect, most significant bit
+  first).
+- `moves.idx.jsonl`: one JSON line per match with keys `a`, `b`, `rep`,
+  `turns`, `off_a` and `off_b` (byte offsets into `moves.bin`).
+
+Both files are only ever appended to. A later entry for the same
+(a, b, rep) key replaces an earlier one. Entries may share data: `alias`
+records a match whose moves equal an already stored match without writing them
+again.
+
+`MoveArchive` memory-maps `moves.bin` and returns `memoryview` slices into it,
+so reading one match copies nothing.
+"""
+from __future__ import annotations
+
+import json
+import mmap
+from pathlib import Path
+from typing import Collection, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - numpy ships with axelrod
+    np = None  # type: ignore
+
+DATA_FILE = "moves.bin"
+INDEX_FILE = "moves.idx.jsonl"
+
+# (a, b, repetition)
+ArchiveKey = Tuple[str, str, int]
+
+
+def _nbytes(turns: int) -> int:
+    return (turns + 7) // 8
+
+
+def pack_moves(moves: Sequence) -> bytes:
+    """Pack a sequence of actions ('C'/'D' or axelrod Actions) into bits."""
+    out = bytearray(_nbytes(len(moves)))
+    for t, move in enumerate(moves):
+        if str(move) == "D":
+            out[t >> 3] |= 0x80 >> (t & 7)
+    return bytes(out)
+
+
+def unpack_moves(data: bytes | memoryview, turns: int) -> str:
+    """Decode packed bits back into a 'C'/'D' string of length `turns`."""
+    return "".join("D" if data[t >> 3] & (0x80 >> (t & 7)) else "C" for t in range(turns))
+
+
+class MoveArchiveWriter:
+    """Append match move histories to an archive directory."""
+
+    def __init__(self, directory: Path | str) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._data = open(self.directory / DATA_FILE, "ab")
+        self._index = open(self.directory / INDEX_FILE, "a", encoding="utf-8")
+        # Entries written by this writer, for `alias`
+        self._entries: Dict[ArchiveKey, dict] = {}
+
+    def _write_entry(self, entry: dict) -> None:
+        self._index.write(json.dumps(entry) + "\n")
+        self._entries[(entry["a"], entry["b"], entry["rep"])] = entry
+
+    def append(self, a: str, b: str, moves: Sequence[Tuple], *, repetition: int = 0) -> None:
+        """Store the (move_a, move_b) pairs of one match between `a` and `b`."""
+        off_a = self._data.tell()
+        bits_a = pack_moves([m[0] for m in moves])
+        bits_b = pack_moves([m[1] for m in moves])
+        self._data.write(bits_a)
+        self._data.write(bits_b)
+        self._write_entry({
+            "a": a, "b": b, "rep": repetition, "turns": len(moves),
+            "off_a": off_a, "off_b": off_a + len(bits_a),
+        })
+
+    def alias(self, source: Tuple[str, str], a: str, b: str, *, repetition: int = 0) -> None:
+        """Record match (a, b) as having the same moves as stored match `source`.
+
+        `source` may be stored in either orientation; offsets are swapped to
+        match. Raises KeyError if this writer has not stored `source`.
+        """
+        src_a, src_b = source
+        entry = self._entries.get((src_a, src_b, repetition))
+        if entry is not None:
+            off_a, off_b = entry["off_a"], entry["off_b"]
+        else:
+            entry = self._entries[(src_b, src_a, repetition)]
+            off_a, off_b = entry["off_b"], entry["off_a"]
+        self._write_entry({
+            "a": a, "b": b, "rep": repetition, "turns": entry["turns"],
+            "off_a": off_a, "off_b": off_b,
+        })
+
+    def written_keys(self) -> List[ArchiveKey]:
+        """Keys of the matches stored by this writer (not earlier sessions)."""
+        return list(self._entries)
+
+    def close(self) -> None:
+        self._data.close()
+        self._index.close()
+
+    def __enter__(self) -> "MoveArchiveWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class MoveArchive:
+    """Read-only, memory-mapped view of an archive directory."""
+
+    def __init__(self, directory: Path | str) -> None:
+        self.directory = Path(directory)
+        self._entries: Dict[ArchiveKey, dict] = {}
+        with open(self.directory / INDEX_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._entries[(entry["a"], entry["b"], entry["rep"])] = entry
+
+        self._file = open(self.directory / DATA_FILE, "rb")
+        size = (self.directory / DATA_FILE).stat().st_size
+        # mmap cannot map an empty file
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self._view = memoryview(self._mm) if self._mm is not None else memoryview(b"")
+
+    def close(self) -> None:
+        self._view.release()
+        if self._mm is not None:
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "MoveArchive":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def keys(self) -> Iterator[ArchiveKey]:
+        return iter(self._entries)
+
+    def _lookup(self, a: str, b: str, rep: int) -> Tuple[dict, bool]:
+        """Return (entry, swapped); matches may be requested in either order."""
+        entry = self._entries.get((a, b, rep))
+        if entry is not None:
+            return entry, False
+        return self._entries[(b, a, rep)], True
+
+    def raw(self, a: str, b: str, rep: int = 0) -> Tuple[memoryview, memoryview, int]:
+        """Return zero-copy packed bits for a's and b's moves, and the turn count.
+
+        The views point into the memory map; release them before `close()`.
+        """
+        entry, swapped = self._lookup(a, b, rep)
+        n = _nbytes(entry["turns"])
+        bits_a = self._view[entry["off_a"]:entry["off_a"] + n]
+        bits_b = self._view[entry["off_b"]:entry["off_b"] + n]
+        if swapped:
+            bits_a, bits_b = bits_b, bits_a
+        return bits_a, bits_b, entry["turns"]
+
+    def moves(self, a: str, b: str, rep: int = 0) -> Tuple[str, str]:
+        """Return the decoded 'C'/'D' move strings for a and b."""
+        bits_a, bits_b, turns = self.raw(a, b, rep)
+        return unpack_moves(bits_a, turns), unpack_moves(bits_b, turns)
+
+    def first_defection(self, a: str, b: str, rep: int = 0) -> Tuple[Optional[int], Optional[int]]:
+        """Return the first turn (0-based) at which a and b defected, or None."""
+        moves_a, moves_b = self.moves(a, b, rep)
+        first_a = moves_a.find("D")
+        first_b = moves_b.find("D")
+        return (first_a if first_a >= 0 else None), (first_b if first_b >= 0 else None)
+
+    def _sides(self, player: Optional[str]) -> Iterator[Tuple[int, int]]:
+        """Yield (offset, turns) for every stored move sequence of `player` (all if None)."""
+        for (a, b, _), entry in self._entries.items():
+            if player is None or a == player:
+                yield entry["off_a"], entry["turns"]
+            if player is None or b == player:
+                yield entry["off_b"], entry["turns"]
+
+    def cooperation_by_turn(self, player: Optional[str] = None) -> List[float]:
+        """Cooperation rate at each turn across all matches (optionally one player's moves)."""
+        defects: List[int] = []
+        counts: List[int] = []
+        if np is not None and self._mm is not None:
+            buf = np.frombuffer(self._mm, dtype=np.uint8)
+            by_turns: Dict[int, List[int]] = {}
+            for off, turns in self._sides(player):
+                by_turns.setdefault(turns, []).append(off)
+            for turns, offsets in by_turns.items():
+                n = _nbytes(turns)
+                idx = np.asarray(offsets, dtype=np.int64)[:, None] + np.arange(n)
+                bits = np.unpackbits(buf[idx], axis=1)[:, :turns]
+                _grow(defects, counts, turns)
+                per_turn = bits.sum(axis=0)
+                for t in range(turns):
+                    defects[t] += int(per_turn[t])
+                    counts[t] += len(offsets)
+        else:
+            for off, turns in self._sides(player):
+                _grow(defects, counts, turns)
+                seq = unpack_moves(self._view[off:off + _nbytes(turns)], turns)
+                for t, move in enumerate(seq):
+                    defects[t] += move == "D"
+                    counts[t] += 1
+        return [1 - d / c for d, c in zip(defects, counts)]
+
+    def cooperation_rates(self, keys: Optional[Collection[ArchiveKey]] = None) -> Dict[str, float]:
+        """Overall cooperation rate per player across archived matches.
+
+        With `keys` (e.g. `MoveArchiveWriter.written_keys()`), only those
+        matches count, so one run can be summarised in a reused archive.
+        """
+        if keys is not None:
+            keys = set(keys)
+        # One pass over the index: every stored side, grouped by match length
+        players: Dict[str, int] = {}
+        by_turns: Dict[int, Tuple[List[int], List[int]]] = {}
+        for key, entry in self._entries.items():
+            if keys is not None and key not in keys:
+                continue
+            offsets, owners = by_turns.setdefault(entry["turns"], ([], []))
+            for name, off in ((key[0], entry["off_a"]), (key[1], entry["off_b"])):
+                offsets.append(off)
+                owners.append(players.setdefault(name, len(players)))
+
+        defects = [0] * len(players)
+        total = [0] * len(players)
+        if np is not None and self._mm is not None:
+            buf = np.frombuffer(self._mm, dtype=np.uint8)
+            defect_sums = np.zeros(len(players), dtype=np.int64)
+            turn_sums = np.zeros(len(players), dtype=np.int64)
+            for turns, (offsets, owners) in by_turns.items():
+                idx = np.asarray(offsets, dtype=np.int64)[:, None] + np.arange(_nbytes(turns))
+                per_side = np.unpackbits(buf[idx], axis=1).sum(axis=1)
+                owner_idx = np.asarray(owners, dtype=np.int64)
+                defect_sums += np.bincount(owner_idx, weights=per_side, minlength=len(players)).astype(np.int64)
+                turn_sums += np.bincount(owner_idx, minlength=len(players)) * turns
+            defects = defect_sums.tolist()
+            total = turn_sums.tolist()
+        else:
+            for turns, (offsets, owners) in by_turns.items():
+                n = _nbytes(turns)
+                for off, p in zip(offsets, owners):
+                    # Padding bits past `turns` are always zero
+                    defects[p] += int.from_bytes(self._view[off:off + n], "big").bit_count()
+                    total[p] += turns
+        return {
+            name: 1 - defects[p] / total[p] if total[p] else 0.0
+            for name, p in sorted(players.items())
+        }
+
+def _grow(defects: List[int], counts: List[int], turns: int) -> None:
+    while len(defects) < turns:
+        defects.append(0)
+        counts.append(0)
@@ -0,0 +1,105 @@
+"""Behavioural fingerprinting to detect duplicate player strategies.
+
+Each player is probed against a fixed set of deterministic opponents and the
+resulting move sequences are hashed. Players whose probe histories agree are
+treated as behaviourally equivalent. A player whose probe histories change
+between two different seeds is flagged as stochastic and never grouped.
+
+Fingerprints are a heuristic: two players that agree on every probe may still
+diverge against some other opponent. Probes were chosen to exercise the common
+reactive patterns (retaliation, forgiveness, grudges, alternation).
+"""
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Type
+
+from .referee import play_moves
+
+try:
+    import axelrod as axl
+except Exception:  # pragma: no cover
+    axl = None  # type: ignore
+
+# Seeds used to detect stochastic players; independent of the tournament seed.
+PROBE_SEEDS = (0, 1)
+
+
+def default_probes() -> List[Type]:
+    """Return the deterministic Axelrod strategies used as probe opponents."""
+    if axl is None:  # pragma: no cover - dependency guard
+        raise RuntimeError("Axelrod is not available. Install it to fingerprint players.")
+    return [
+        axl.Cooperator,
+        axl.Defector,
+        axl.Alternator,
+        axl.TitForTat,
+        axl.SuspiciousTitForTat,
+        axl.Grudger,
+        axl.CyclerCCD,
+        axl.CyclerDDC,
+    ]
+
+
+@dataclass
+class FingerprintReport:
+    players: List[str]
+    fingerprints: Dict[str, str]
+    stochastic: List[str]
+    # Index of each deterministic player -> index of its cluster representative
+    representatives: Dict[int, int] = field(default_factory=dict)
+    # Matches played against probes (players x probes x probe seeds)
+    probe_matches: int = 0
+
+    def clusters(self) -> List[List[str]]:
+        """Return groups of behaviourally identical players (size > 1 only)."""
+        groups: Dict[int, List[str]] = {}
+        for idx, rep in self.representatives.items():
+            groups.setdefault(rep, []).append(self.players[idx])
+        return [members for _, members in sorted(groups.items()) if len(members) > 1]
+
+
+def _probe_history(cls: Type, probes: Sequence[Type], turns: int, seed: int) -> str:
+    """Encode the player's own moves against every probe as one string."""
+    parts: List[str] = []
+    for probe in probes:
+        moves = play_moves(cls, probe, turns=turns, seed=seed)
+        parts.append("".join(str(a) for a, _ in moves))
+    return "|".join(parts)
+
+
+def fingerprint_players(
+    player_classes: Sequence[Type],
+    *,
+    turns: int = 200,
+    probes: Optional[Sequence[Type]] = None,
+) -> FingerprintReport:
+    """Fingerprint each player class and group behaviourally identical ones.
+
+    Probes are played at the tournament's match length, since some strategies
+    behave differently near the end of a match.
+    """
+    probes = list(probes) if probes is not None else default_probes()
+    names = [cls.__name__ for cls in player_classes]
+    fingerprints: Dict[str, str] = {}
+    stochastic: List[str] = []
+    representatives: Dict[int, int] = {}
+    first_seen: Dict[str, int] = {}
+
+    for idx, cls in enumerate(player_classes):
+        histories = [_probe_history(cls, probes, turns, s) for s in PROBE_SEEDS]
+        digest = hashlib.sha256(histories[0].encode("utf-8")).hexdigest()
+        fingerprints[names[idx]] = digest
+        if any(h != histories[0] for h in histories[1:]):
+            stochastic.append(names[idx])
+            continue
+        representatives[idx] = first_seen.setdefault(digest, idx)
+
+    return FingerprintReport(
+        players=names,
+        fingerprints=fingerprints,
+        stochastic=stochastic,
+        representatives=representatives,
+        probe_matches=len(player_classes) * len(probes) * len(PROBE_SEEDS),
+    )
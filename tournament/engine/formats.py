@@ -0,0 +1,355 @@
+"""Sub-quadratic tournament formats for large fields.
+
+The full round robin plays n(n-1)/2 matches. The formats here play far fewer
+and report totals on the same scale: each player's mean score per match
+multiplied by (n - 1), i.e. an estimate of what the player would have scored in
+the full round robin. Matches are played with the same referee and `seed` as
+`run_round_robin`; `seed` also drives the pairing RNG.
+
+- `run_swiss`: players meet opponents with similar running scores.
+- `run_sampled_round_robin`: each player meets k random opponents; the scaled
+  totals are unbiased estimates of full round-robin totals.
+- `run_group_stage`: round robins within groups, then a round-robin playoff
+  among the top finishers of each group.
+
+`estimate_rank_correlation` measures how closely a format's ranking tracks the
+full round robin on random subsets of the field.
+"""
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Type
+
+from .referee import play_match
+from .tournament import MatchResult, TournamentResult, run_round_robin
+
+
+def _play_pairs(
+    player_classes: Sequence[Type],
+    pairs: Sequence[Tuple[int, int]],
+    *,
+    turns: int,
+    seed: Optional[int],
+) -> List[MatchResult]:
+    matches: List[MatchResult] = []
+    for i, j in pairs:
+        a_cls = player_classes[i]
+        b_cls = player_classes[j]
+        score_a, score_b = play_match(a_cls, b_cls, turns=turns, seed=seed)
+        matches.append(MatchResult(a_cls.__name__, b_cls.__name__, score_a, score_b))
+    return matches
+
+
+def _per_player_scores(names: Sequence[str], matches: Sequence[MatchResult]) -> Dict[str, List[int]]:
+    scores: Dict[str, List[int]] = {name: [] for name in names}
+    for m in matches:
+        scores[m.a].append(m.score_a)
+        scores[m.b].append(m.score_b)
+    return scores
+
+
+def _scaled_totals(names: Sequence[str], matches: Sequence[MatchResult]) -> Dict[str, int]:
+    """Scale each player's mean score per match to a full round-robin total."""
+    opponents = len(names) - 1
+    totals: Dict[str, int] = {}
+    for name, scores in _per_player_scores(names, matches).items():
+        mean = sum(scores) / len(scores) if scores else 0.0
+        totals[name] = round(mean * opponents)
+    return totals
+
+
+def run_swiss(
+    player_classes: Sequence[Type],
+    *,
+    rounds: Optional[int] = None,
+    turns: int = 200,
+    seed: Optional[int] = None,
+) -> TournamentResult:
+    """Run a Swiss-system tournament.
+
+    Each round, players are sorted by mean score so far and paired with the
+    nearest-ranked opponent they have not met yet. With an odd field, the
+    lowest-ranked player without a bye sits out. Defaults to ceil(log2 n) + 1
+    rounds. Opponents are not random, so totals are not unbiased estimates.
+    """
+    names = [cls.__name__ for cls in player_classes]
+    n = len(player_classes)
+    if rounds is None:
+        rounds = math.ceil(math.log2(n)) + 1 if n > 1 else 0
+    rng = random.Random(seed)
+
+    order = list(range(n))
+    rng.shuffle(order)  # breaks ties in the first round's standings
+    sums = [0] * n
+    counts = [0] * n
+    met: Set[Tuple[int, int]] = set()
+    had_bye: Set[int] = set()
+    matches: List[MatchResult] = []
+
+    for _ in range(rounds):
+        standings = sorted(order, key=lambda i: sums[i] / counts[i] if counts[i] else 0.0, reverse=True)
+        if n % 2 == 1:
+            bye = next((i for i in reversed(standings) if i not in had_bye), standings[-1])
+            had_bye.add(bye)
+            standings.remove(bye)
+
+        pairs: List[Tuple[int, int]] = []
+        pool = list(standings)
+        while len(pool) > 1:
+            a = pool.pop(0)
+            # nearest-ranked opponent not yet met; fall back to a rematch
+            pick = next((k for k, b in enumerate(pool) if (min(a, b), max(a, b)) not in met), 0)
+            b = pool.pop(pick)
+            met.add((min(a, b), max(a, b)))
+            pairs.append((min(a, b), max(a, b)))
+
+        for (i, j), m in zip(pairs, _play_pairs(player_classes, pairs, turns=turns, seed=seed)):
+            sums[i] += m.score_a
+            sums[j] += m.score_b
+            counts[i] += 1
+            counts[j] += 1
+            matches.append(m)
+
+    return TournamentResult(players=names, totals=_scaled_totals(names, matches), matches=matches)
+
+
+def sample_pairings(n: int, k: int, rng: random.Random, *, attempts: int = 20) -> List[Tuple[int, int]]:
+    """Return pairings in which each of n players meets about k random opponents.
+
+    Built from k random perfect matchings. When n is odd, one player sits out
+    each matching; the bye rotates among the players who have sat out least,
+    and a player left without any match (only possible when k is 1) meets one
+    extra random opponent. Each matching is redrawn up to `attempts` times to
+    avoid repeating an earlier pair. Every player's opponents stay uniformly
+    distributed, which keeps per-player mean scores unbiased.
+    """
+    k = min(k, n - 1)
+    seen: Set[Tuple[int, int]] = set()
+    pairs: List[Tuple[int, int]] = []
+    byes = [0] * n
+    for _ in range(k):
+        players = list(range(n))
+        if n % 2 == 1:
+            fewest = min(byes)
+            bye = rng.choice([i for i in players if byes[i] == fewest])
+            byes[bye] += 1
+            players.remove(bye)
+        best: List[Tuple[int, int]] = []
+        best_repeats = -1
+        for _ in range(max(1, attempts)):
+            order = list(players)
+            rng.shuffle(order)
+            matching = [
+                (min(order[p], order[p + 1]), max(order[p], order[p + 1]))
+                for p in range(0, len(order) - 1, 2)
+            ]
+            repeats = sum(1 for pair in matching if pair in seen)
+            if best_repeats < 0 or repeats < best_repeats:
+                best, best_repeats = matching, repeats
+            if repeats == 0:
+                break
+        seen.update(best)
+        pairs.extend(best)
+
+    paired = {i for pair in pairs for i in pair}
+    for i in range(n if k > 0 else 0):
+        if i not in paired:
+            j = rng.choice([other for other in range(n) if other != i])
+            pairs.append((min(i, j), max(i, j)))
+    return pairs
+
+
+def run_sampled_round_robin(
+    player_classes: Sequence[Type],
+    *,
+    k: int = 10,
+    turns: int = 200,
+    seed: Optional[int] = None,
+) -> TournamentResult:
+    """Run a sampled round robin where each player meets k random opponents.
+
+    Plays about n*k/2 matches instead of n(n-1)/2. Totals are each player's mean
+    score per match times (n - 1), an unbiased estimate of the full total.
+    """
+    names = [cls.__name__ for cls in player_classes]
+    pairs = sample_pairings(len(player_classes), k, random.Random(seed))
+    matches = _play_pairs(player_classes, pairs, turns=turns, seed=seed)
+    return TournamentResult(players=names, totals=_scaled_totals(names, matches), matches=matches)
+
+
+@dataclass
+class GroupStageResult(TournamentResult):
+    groups: List[List[str]] = field(default_factory=list)
+    qualifiers: List[str] = field(default_factory=list)
+    playoff_totals: Dict[str, int] = field(default_factory=dict)
+
+    def ranking(self) -> List[Tuple[str, int]]:
+        """Qualifiers by playoff score, then everyone else by estimated total."""
+        top = sorted(self.qualifiers, key=lambda name: self.playoff_totals[name], reverse=True)
+        rest = sorted(
+            (name for name in self.players if name not in self.playoff_totals),
+            key=lambda name: self.totals[name],
+            reverse=True,
+        )
+        return [(name, self.totals[name]) for name in top + rest]
+
+
+def run_group_stage(
+    player_classes: Sequence[Type],
+    *,
+    group_size: int = 8,
+    advance: int = 2,
+    prior: Optional[Sequence[str]] = None,
+    turns: int = 200,
+    seed: Optional[int] = None,
+) -> GroupStageResult:
+    """Run round-robin groups followed by a round-robin playoff.
+
+    Players are split into groups of about `group_size`. With `prior` (player
+    names, strongest first, e.g. a previous ranking) groups are filled in snake
+    order so strong players are spread out; otherwise the draw is random. The
+    top `advance` players of each group meet again in the playoff.
+    """
+    names = [cls.__name__ for cls in player_classes]
+    by_name = {cls.__name__: cls for cls in player_classes}
+    n = len(player_classes)
+    n_groups = max(1, math.ceil(n / max(2, group_size)))
+
+    if prior is not None:
+        ranked = [name for name in prior if name in by_name]
+        seen = set(ranked)
+        ranked += [name for name in names if name not in seen]
+    else:
+        ranked = list(names)
+        random.Random(seed).shuffle(ranked)
+
+    groups: List[List[str]] = [[] for _ in range(n_groups)]
+    for pos, name in enumerate(ranked):
+        lap, slot = divmod(pos, n_groups)
+        groups[slot if lap % 2 == 0 else n_groups - 1 - slot].append(name)
+
+    matches: List[MatchResult] = []
+    qualifiers: List[str] = []
+    for group in groups:
+        result = run_round_robin([by_name[name] for name in group], turns=turns, seed=seed)
+        matches.extend(result.matches)
+        qualifiers.extend(name for name, _ in result.ranking()[:advance])
+
+    playoff = run_round_robin([by_name[name] for name in qualifiers], turns=turns, seed=seed)
+    matches.extend(playoff.matches)
+
+    return GroupStageResult(
+        players=names,
+        totals=_scaled_totals(names, matches),
+        matches=matches,
+        groups=groups,
+        qualifiers=qualifiers,
+        playoff_totals=playoff.totals,
+    )
+
+
+def _positions(ranking: Sequence[Tuple[str, int]]) -> Dict[str, float]:
+    """Rank positions (1 = best) from list order, averaging runs of equal scores."""
+    ranks: Dict[str, float] = {}
+    pos = 0
+    while pos < len(ranking):
+        end = pos
+        while end + 1 < len(ranking) and ranking[end + 1][1] == ranking[pos][1]:
+            end += 1
+        for name, _ in ranking[pos:end + 1]:
+            ranks[name] = (pos + end) / 2 + 1
+        pos = end + 1
+    return ranks
+
+
+def spearman(ranking_a: Sequence[Tuple[str, int]], ranking_b: Sequence[Tuple[str, int]]) -> float:
+    """Spearman rank correlation between two rankings of the same players.
+
+    Positions come from list order, so format-specific orderings (e.g. a
+    playoff) are respected; adjacent entries with equal scores share a rank.
+    """
+    pos_a = _positions(ranking_a)
+    pos_b = _positions(ranking_b)
+    names = list(pos_a)
+    n = len(names)
+    if n < 2:
+        return 1.0
+    ra = [pos_a[name] for name in names]
+    rb = [pos_b[name] for name in names]
+    mean_a = sum(ra) / n
+    mean_b = sum(rb) / n
+    cov = sum((x - mean_a) * (y - mean_b) for x, y in zip(ra, rb))
+    var_a = sum((x - mean_a) ** 2 for x in ra)
+    var_b = sum((y - mean_b) ** 2 for y in rb)
+    if not var_a or not var_b:
+        return 1.0 if var_a == var_b else 0.0
+    return cov / math.sqrt(var_a * var_b)
+
+
+def scale_format_options(options: Dict[str, object], n: int, subset_size: int) -> Dict[str, object]:
+    """Adapt format options from a field of n players to a subset of subset_size.
+
+    `k` keeps the same share of possible opponents and an explicit Swiss
+    `rounds` shrinks with log2 of the field size. `group_size` and `advance`
+    describe a single group, so they are kept; they are only capped so the
+    subset still forms at least two groups with at least one player
+    eliminated per group. The subset therefore has fewer groups, and a smaller
+    playoff, than the full field.
+    """
+    size = min(subset_size, n)
+    if size >= n or n < 2:
+        return dict(options)
+    scaled = dict(options)
+    if scaled.get("k") is not None:
+        scaled["k"] = max(1, round(int(scaled["k"]) * (size - 1) / (n - 1)))
+    if scaled.get("group_size") is not None:
+        scaled["group_size"] = max(2, min(int(scaled["group_size"]), size // 2))
+        if scaled.get("advance") is not None:
+            scaled["advance"] = max(1, min(int(scaled["advance"]), int(scaled["group_size"]) - 1))
+    if scaled.get("rounds") is not None:
+        scaled["rounds"] = max(1, round(int(scaled["rounds"]) * math.log2(size) / math.log2(n)))
+    return scaled
+
+
+@dataclass
+class RankAgreement:
+    mean: float
+    minimum: float
+    samples: List[float]
+    subset_size: int
+
+
+def estimate_rank_correlation(
+    run_format: Callable[..., TournamentResult],
+    player_classes: Sequence[Type],
+    *,
+    subset_size: int = 24,
+    trials: int = 3,
+    turns: int = 200,
+    seed: Optional[int] = None,
+    **format_kwargs,
+) -> RankAgreement:
+    """Estimate how well a format's ranking matches the full round robin.
+
+    Draws `trials` random subsets of `subset_size` players, runs both the full
+    round robin and `run_format` on each, and reports the Spearman correlation.
+    Fixed-size parameters such as `k` cover a larger share of a small subset
+    than of the full field, so scale them down for a fair estimate (see
+    `scale_format_options`).
+    """
+    rng = random.Random(seed)
+    size = min(subset_size, len(player_classes))
+    samples: List[float] = []
+    for _ in range(max(1, trials)):
+        subset = rng.sample(list(player_classes), size)
+        full = run_round_robin(subset, turns=turns, seed=seed)
+        approx = run_format(subset, turns=turns, seed=seed, **format_kwargs)
+        samples.append(spearman(full.ranking(), approx.ranking()))
+    return RankAgreement(
+        mean=sum(samples) / len(samples),
+        minimum=min(samples),
+        samples=samples,
+        subset_size=size,
+    )
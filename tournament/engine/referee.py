@@ -1,43 +1,86 @@
 """Referee utilities to run matches between two Axelrod players."""
 from __future__ import annotations
 
-from typing import Tuple, Type, Optional
+import random
+from typing import Any, List, Tuple, Type, Optional
 
 try:
     import axelrod as axl
 except Exception:  # pragma: no cover
     axl = None  # type: ignore
 
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
 
-def play_match(
+
+def play_moves(
     player_a_cls: Type,
     player_b_cls: Type,
     *,
     turns: int = 200,
     seed: Optional[int] = None,
-) -> Tuple[int, int]:
+) -> List[Tuple]:
     """Play a single match between two player classes.
 
-    Returns a tuple of cumulative scores (score_a, score_b).
+    With `seed`, the match is seeded through Axelrod and the global `random`
+    and numpy generators are reseeded as well, since player code may use them.
+    Returns the per-turn list of (move_a, move_b) action pairs.
     """
     if axl is None:  # pragma: no cover - dependency guard
         raise RuntimeError("Axelrod is not available. Install it to run matches.")
 
+    # Axelrod seeds only its own per-player RNG; players may also draw from the
+    # global `random` or numpy generators, so seed those too for reproducibility
     if seed is not None:
-        axl.seed(seed)
+        random.seed(seed)
+        if np is not None:
+            np.random.seed(seed)
 
     # Instantiate players and run a match
     p1 = player_a_cls()
     p2 = player_b_cls()
-    match = axl.Match((p1, p2), turns=turns)
-    result = match.play()
+    match = axl.Match((p1, p2), turns=turns, seed=seed)
+    return list(match.play())
+
+
+def score_moves(moves: List[Tuple]) -> Tuple[int, int]:
+    """Sum the Axelrod game scores over a list of (move_a, move_b) pairs.
+
+    Returns plain ints: `Game.score` yields numpy integers, which results
+    must not carry into JSON output.
+    """
+    if axl is None:  # pragma: no cover - dependency guard
+        raise RuntimeError("Axelrod is not available. Install it to score matches.")
 
     game = axl.Game()
     score_a = 0
     score_b = 0
-    for a_move, b_move in result:
+    for a_move, b_move in moves:
         a_s, b_s = game.score((a_move, b_move))
         score_a += a_s
         score_b += b_s
 
-    return score_a, score_b
+    return int(score_a), int(score_b)
+
+
+def play_match(
+    player_a_cls: Type,
+    player_b_cls: Type,
+    *,
+    turns: int = 200,
+    seed: Optional[int] = None,
+    archive: Optional[Any] = None,
+    repetition: int = 0,
+) -> Tuple[int, int]:
+    """Play a single match between two player classes.
+
+    Returns a tuple of cumulative scores (score_a, score_b). If `archive` (a
+    `MoveArchiveWriter`) is given, the per-turn moves are stored in it under
+    (a, b, repetition).
+    """
+    moves = play_moves(player_a_cls, player_b_cls, turns=turns, seed=seed)
+    if archive is not None:
+        archive.append(player_a_cls.__name__, player_b_cls.__name__, moves, repetition=repetition)
+    return score_moves(moves)
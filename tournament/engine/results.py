@@ -0,0 +1,274 @@
+"""Stored tournament results with incrementally maintained aggregate indexes.
+
+A results store is a directory with:
+
+- `runs/<run_id>.jsonl`: raw match records of each run (one JSON line per match).
+- `index.json`: aggregates updated whenever a run is added:
+  - `runs`: per-run snapshots (parameters, series, totals, ranking, cooperation)
+  - `series`: aggregates per series of comparable runs, i.e. runs with the same
+    parameters apart from the seed (format, turns, player count, format
+    options such as k or group size):
+    - `players`: per-player totals (runs, total, matches, best rank)
+    - `head_to_head`: cumulative points for/against and match count per
+      ordered pair of players
+
+Totals from different formats, match lengths or field sizes (totals grow with
+the number of opponents) are not comparable, so they are never summed together.
+
+Reports (`leaderboard`, `diff`, `standings`, `head_to_head`, `history`) read
+only the index, never the raw match records, so they stay fast as results
+accumulate.
+"""
+from __future__ import annotations
+
+import datetime as _dt
+import html
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover - avoid importing the engine (and axelrod) for reports
+    from .tournament import TournamentResult
+
+INDEX_FILE = "index.json"
+RUNS_DIR = "runs"
+
+
+def _empty_index() -> dict:
+    return {"runs": [], "series": {}}
+
+
+def series_key(params: Optional[dict]) -> str:
+    """Name the series of comparable runs: all parameters except the seed."""
+    items = sorted((k, v) for k, v in (params or {}).items() if k != "seed" and v is not None)
+    return ", ".join(f"{k}={v}" for k, v in items) or "default"
+
+
+class ResultStore:
+    """Append tournament runs to a directory and keep its aggregate index current."""
+
+    def __init__(self, directory: Path | str) -> None:
+        self.directory = Path(directory)
+        self.index_path = self.directory / INDEX_FILE
+        if self.index_path.exists():
+            self.index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        else:
+            self.index = _empty_index()
+
+    def _new_run_id(self) -> str:
+        base = _dt.datetime.now().strftime("%Y%m%dT%H%M%S")
+        existing = {run["id"] for run in self.index["runs"]}
+        run_id, n = base, 1
+        while run_id in existing:
+            n += 1
+            run_id = f"{base}-{n}"
+        return run_id
+
+    def _save_index(self) -> None:
+        # Write then rename so readers never see a half-written index
+        tmp = self.index_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(self.index, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp, self.index_path)
+
+    def add_run(
+        self,
+        result: "TournamentResult",
+        *,
+        params: Optional[dict] = None,
+        cooperation: Optional[Dict[str, float]] = None,
+    ) -> str:
+        """Store a run's raw matches and fold it into the index. Returns the run id."""
+        run_id = self._new_run_id()
+        runs_dir = self.directory / RUNS_DIR
+        runs_dir.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a failed run leaves no partial run file behind
+        run_path = runs_dir / f"{run_id}.jsonl"
+        tmp = run_path.with_suffix(".jsonl.tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                for m in result.matches:
+                    f.write(json.dumps(asdict(m)) + "\n")
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        os.replace(tmp, run_path)
+
+        ranking = result.ranking()
+        series = series_key(params)
+        self.index["runs"].append({
+            "id": run_id,
+            "created": _dt.datetime.now().isoformat(timespec="seconds"),
+            "params": params or {},
+            "series": series,
+            "totals": dict(result.totals),
+            "ranking": [name for name, _ in ranking],
+            "matches": len(result.matches),
+            "cooperation": cooperation or {},
+        })
+
+        aggregates = self.index["series"].setdefault(series, {"players": {}, "head_to_head": {}})
+        players = aggregates["players"]
+        for rank, (name, total) in enumerate(ranking, start=1):
+            entry = players.setdefault(name, {"runs": 0, "total": 0, "matches": 0, "best_rank": rank})
+            entry["runs"] += 1
+            entry["total"] += total
+            entry["best_rank"] = min(entry["best_rank"], rank)
+
+        h2h = aggregates["head_to_head"]
+        for m in result.matches:
+            for me, opp, pts_for, pts_against in ((m.a, m.b, m.score_a, m.score_b), (m.b, m.a, m.score_b, m.score_a)):
+                cell = h2h.setdefault(me, {}).setdefault(opp, [0, 0, 0])
+                cell[0] += pts_for
+                cell[1] += pts_against
+                cell[2] += 1
+                players[me]["matches"] += 1
+
+        self._save_index()
+        return run_id
+
+    def run(self, run_id: Optional[str] = None, *, offset: int = 0) -> dict:
+        """Return a run snapshot by id, or the latest run shifted back by `offset`."""
+        runs = self.index["runs"]
+        if run_id is not None:
+            for run in runs:
+                if run["id"] == run_id:
+                    return run
+            raise KeyError(f"No run {run_id!r} in {self.directory}")
+        if len(runs) <= offset:
+            raise KeyError(f"Only {len(runs)} run(s) in {self.directory}")
+        return runs[-1 - offset]
+
+    def series(self, name: Optional[str] = None) -> Tuple[str, dict]:
+        """Return (name, aggregates) of a series; defaults to the latest run's series."""
+        if name is None:
+            name = self.run()["series"]
+        if name not in self.index["series"]:
+            raise KeyError(f"No series {name!r} in {self.directory}")
+        return name, self.index["series"][name]
+
+    def previous_run(self, run: dict) -> Optional[dict]:
+        """Return the run before `run` in the same series, if any."""
+        earlier = self.index["runs"][:[r["id"] for r in self.index["runs"]].index(run["id"])]
+        same_series = [r for r in earlier if r["series"] == run["series"]]
+        return same_series[-1] if same_series else None
+
+
+def _table(headers: Sequence[str], rows: Sequence[Sequence[object]], fmt: str) -> str:
+    if fmt == "html":
+        head = "".join(f"<th>{html.escape(str(h))}</th>" for h in headers)
+        body = "\n".join(
+            "<tr>" + "".join(f"<td>{html.escape(str(c))}</td>" for c in row) + "</tr>" for row in rows
+        )
+        return f"<table>\n<thead><tr>{head}</tr></thead>\n<tbody>\n{body}\n</tbody>\n</table>\n"
+    lines = [
+        "| " + " | ".join(str(h) for h in headers) + " |",
+        "|" + "|".join("---" for _ in headers) + "|",
+    ]
+    lines += ["| " + " | ".join(str(c) for c in row) + " |" for row in rows]
+    return "\n".join(lines) + "\n"
+
+
+def _heading(text: str, fmt: str) -> str:
+    return f"<h2>{html.escape(text)}</h2>\n" if fmt == "html" else f"## {text}\n\n"
+
+
+def _signed(value: Optional[int]) -> str:
+    if value is None:
+        return "new"
+    return f"{value:+d}" if value else "="
+
+
+def _describe(run: dict) -> str:
+    params = ", ".join(f"{k}={v}" for k, v in sorted(run["params"].items()) if v is not None)
+    return f"run {run['id']}" + (f" ({params})" if params else "")
+
+
+def leaderboard(store: ResultStore, run_id: Optional[str] = None, *, fmt: str = "md") -> str:
+    """Ranking of one run (default latest) with rank change since the previous run of its series."""
+    run = store.run(run_id)
+    prev = store.previous_run(run)
+    prev_pos = {name: i for i, name in enumerate(prev["ranking"], start=1)} if prev else {}
+    rows: List[Tuple[object, ...]] = []
+    for rank, name in enumerate(run["ranking"], start=1):
+        move = prev_pos[name] - rank if name in prev_pos else None
+        coop = run["cooperation"].get(name)
+        rows.append((
+            rank,
+            name,
+            run["totals"][name],
+            _signed(move) if prev else "",
+            f"{coop:.3f}" if coop is not None else "",
+        ))
+    return _heading(f"Leaderboard: {_describe(run)}", fmt) + _table(
+        ["Rank", "Player", "Total", "Rank change", "Cooperation"], rows, fmt
+    )
+
+
+def diff(store: ResultStore, run_a: Optional[str] = None, run_b: Optional[str] = None, *, fmt: str = "md") -> str:
+    """Rank and total changes from `run_a` to `run_b`.
+
+    `run_b` defaults to the latest run and `run_a` to the previous run of the
+    same series.
+    """
+    new = store.run(run_b)
+    old = store.run(run_a) if run_a is not None else store.previous_run(new)
+    if old is None:
+        raise KeyError(f"No earlier run in series {new['series']!r} to diff against")
+    old_pos = {name: i for i, name in enumerate(old["ranking"], start=1)}
+    new_pos = {name: i for i, name in enumerate(new["ranking"], start=1)}
+    rows: List[Tuple[object, ...]] = []
+    for name in new["ranking"]:
+        if name in old_pos:
+            rows.append((name, old_pos[name], new_pos[name], _signed(old_pos[name] - new_pos[name]),
+                         old["totals"][name], new["totals"][name],
+                         _signed(new["totals"][name] - old["totals"][name])))
+        else:
+            rows.append((name, "", new_pos[name], "new", "", new["totals"][name], "new"))
+    for name in old["ranking"]:
+        if name not in new_pos:
+            rows.append((name, old_pos[name], "", "removed", old["totals"][name], "", "removed"))
+    return _heading(f"Changes from {old['id']} to {new['id']}", fmt) + _table(
+        ["Player", "Old rank", "New rank", "Rank change", "Old total", "New total", "Total change"], rows, fmt
+    )
+
+
+def standings(store: ResultStore, series: Optional[str] = None, *, fmt: str = "md") -> str:
+    """Players ranked by mean total per run within one series of comparable runs."""
+    name, aggregates = store.series(series)
+    players = aggregates["players"]
+    ordered = sorted(players.items(), key=lambda kv: kv[1]["total"] / kv[1]["runs"], reverse=True)
+    rows = [
+        (rank, player, entry["runs"], f"{entry['total'] / entry['runs']:.1f}", entry["best_rank"], entry["matches"])
+        for rank, (player, entry) in enumerate(ordered, start=1)
+    ]
+    return _heading(f"Standings: {name}", fmt) + _table(
+        ["Rank", "Player", "Runs", "Mean total", "Best rank", "Matches"], rows, fmt
+    )
+
+
+def head_to_head(store: ResultStore, player: str, series: Optional[str] = None, *, fmt: str = "md") -> str:
+    """Per-opponent breakdown for `player`, cumulative over one series of runs."""
+    name, aggregates = store.series(series)
+    opponents = aggregates["head_to_head"].get(player)
+    if opponents is None:
+        raise KeyError(f"No results for player {player!r} in series {name!r}")
+    rows = []
+    for opp, (pts_for, pts_against, n) in sorted(opponents.items(), key=lambda kv: kv[1][0] / kv[1][2], reverse=True):
+        rows.append((opp, n, f"{pts_for / n:.1f}", f"{pts_against / n:.1f}", _signed(round((pts_for - pts_against) / n))))
+    return _heading(f"Head to head: {player} ({name})", fmt) + _table(
+        ["Opponent", "Matches", "Avg for", "Avg against", "Avg margin"], rows, fmt
+    )
+
+
+def history(store: ResultStore, player: str, *, fmt: str = "md") -> str:
+    """Rank and total of `player` in every stored run, with each run's series."""
+    rows = []
+    for run in store.index["runs"]:
+        if player in run["totals"]:
+            rows.append((run["id"], run["series"], run["ranking"].index(player) + 1, len(run["ranking"]),
+                         run["totals"][player]))
+    if not rows:
+        raise KeyError(f"No results for player {player!r}")
+    return _heading(f"History: {player}", fmt) + _table(["Run", "Series", "Rank", "Players", "Total"], rows, fmt)
@@ -1,9 +1,10 @@
 """Round-robin tournament harness for Axelrod player classes."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Sequence, Tuple, Type, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence, Tuple, Type, Optional
 
+from .fingerprint import fingerprint_players
 from .referee import play_match
 
 
@@ -20,6 +21,11 @@ class TournamentResult:
     players: List[str]
     totals: Dict[str, int]
     matches: List[MatchResult]
+    # Groups of behaviourally identical players (only populated with dedupe)
+    duplicates: List[List[str]] = field(default_factory=list)
+    simulated: int = 0
+    # Fingerprint probe matches played before the tournament (only with dedupe)
+    probe_matches: int = 0
 
     def ranking(self) -> List[Tuple[str, int]]:
         return sorted(self.totals.items(), key=lambda kv: kv[1], reverse=True)
@@ -30,25 +36,69 @@ def run_round_robin(
     *,
     turns: int = 200,
     seed: Optional[int] = None,
+    dedupe: bool = False,
+    archive: Optional[Any] = None,
 ) -> TournamentResult:
     """Run a simple round-robin tournament among the given player classes.
 
     Each pair plays once. Scores from the Axelrod game are summed.
+
+    With `dedupe`, players are fingerprinted first and deterministic players
+    with identical behaviour share results: the pairing between two clusters
+    is simulated once and the scores are copied to every equivalent pairing.
+    Pairings involving a stochastic player are always simulated.
+    Fingerprinting itself plays 16 probe matches per player (reported as
+    `probe_matches`), so dedupe only pays off on fields with many duplicates or
+    far more players than probes.
+
+    With `archive` (a `MoveArchiveWriter`), every match's moves are stored;
+    shared results are recorded as aliases of the simulated match.
     """
     names = [cls.__name__ for cls in player_classes]
     totals: Dict[str, int] = {name: 0 for name in names}
     matches: List[MatchResult] = []
 
+    representatives: Dict[int, int] = {}
+    duplicates: List[List[str]] = []
+    probe_matches = 0
+    if dedupe:
+        report = fingerprint_players(player_classes, turns=turns)
+        representatives = report.representatives
+        duplicates = report.clusters()
+        probe_matches = report.probe_matches
+    # representative pair -> (score_a, score_b, simulated pair names in the same orientation)
+    shared: Dict[Tuple[int, int], Tuple[int, int, Tuple[str, str]]] = {}
+    simulated = 0
+
     n = len(player_classes)
     for i in range(n):
         for j in range(i + 1, n):
             a_cls = player_classes[i]
             b_cls = player_classes[j]
-            score_a, score_b = play_match(a_cls, b_cls, turns=turns, seed=seed)
+            key = None
+            if i in representatives and j in representatives:
+                key = (representatives[i], representatives[j])
             name_a = a_cls.__name__
             name_b = b_cls.__name__
+            if key is not None and key in shared:
+                score_a, score_b, source = shared[key]
+                if archive is not None:
+                    archive.alias(source, name_a, name_b)
+            else:
+                score_a, score_b = play_match(a_cls, b_cls, turns=turns, seed=seed, archive=archive)
+                simulated += 1
+                if key is not None:
+                    shared[key] = (score_a, score_b, (name_a, name_b))
+                    shared[(key[1], key[0])] = (score_b, score_a, (name_b, name_a))
             totals[name_a] += score_a
             totals[name_b] += score_b
             matches.append(MatchResult(name_a, name_b, score_a, score_b))
 
-    return TournamentResult(players=names, totals=totals, matches=matches)
+    return TournamentResult(
+        players=names,
+        totals=totals,
+        matches=matches,
+        duplicates=duplicates,
+        simulated=simulated,
+        probe_matches=probe_matches,
+    )
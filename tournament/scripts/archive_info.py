@@ -0,0 +1,71 @@
+"""Inspect a move-history archive written by `run_tournament --archive`.
+
+Usage:
+    python -m tournament.scripts.archive_info DIR summary
+    python -m tournament.scripts.archive_info DIR show PLAYER_A PLAYER_B [--rep R]
+    python -m tournament.scripts.archive_info DIR coop [--player NAME] [--every N]
+
+Exit codes:
+    0: success
+    1: requested match not found
+    2: archive could not be read
+"""
+from __future__ import annotations
+
+import argparse
+from typing import List
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Inspect a move-history archive")
+    parser.add_argument("directory", help="Archive directory")
+    sub = parser.add_subparsers(dest="action", required=True)
+    sub.add_parser("summary", help="Match count and per-player cooperation rates")
+    show = sub.add_parser("show", help="Print the moves of one match")
+    show.add_argument("a", help="First player class name")
+    show.add_argument("b", help="Second player class name")
+    show.add_argument("--rep", type=int, default=0, help="Repetition number")
+    coop = sub.add_parser("coop", help="Cooperation rate per turn across all matches")
+    coop.add_argument("--player", default=None, help="Only count this player's moves")
+    coop.add_argument("--every", type=int, default=10, help="Print every Nth turn")
+    args = parser.parse_args(argv)
+
+    # Deferred: the archive reader imports numpy when available
+    from tournament.engine.archive import MoveArchive
+
+    try:
+        archive = MoveArchive(args.directory)
+    except (OSError, ValueError) as e:
+        print(f"Unable to read archive: {e}")
+        return 2
+
+    with archive:
+        if args.action == "summary":
+            print(f"{len(archive)} matches in {args.directory}")
+            print("\nCooperation rates:")
+            for name, rate in archive.cooperation_rates().items():
+                print(f" - {name:20} {rate:.3f}")
+            return 0
+
+        if args.action == "show":
+            try:
+                moves_a, moves_b = archive.moves(args.a, args.b, args.rep)
+                first_a, first_b = archive.first_defection(args.a, args.b, args.rep)
+            except KeyError:
+                print(f"No match {args.a} vs {args.b} (rep {args.rep}) in archive.")
+                return 1
+            print(f" {args.a:20} {moves_a}")
+            print(f" {args.b:20} {moves_b}")
+            print(f"\nFirst defection: {args.a} at turn {first_a}, {args.b} at turn {first_b}")
+            return 0
+
+        rates = archive.cooperation_by_turn(args.player)
+        print(" turn  cooperation")
+        for t in range(0, len(rates), max(1, args.every)):
+            print(f" {t + 1:>4}  {rates[t]:.3f}")
+        return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    import sys
+    raise SystemExit(main(sys.argv[1:]))
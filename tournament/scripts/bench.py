@@ -0,0 +1,153 @@
+"""Measure startup cost of the `tournament` CLI.
+
+Runs each lightweight command in a fresh interpreter with `-X importtime` and
+reports wall time, total import time, and whether heavy modules (`axelrod` or
+student player modules) were imported. Intended to be run in CI so startup
+regressions are caught.
+
+Usage:
+    python -m tournament.scripts.bench [--repeat N] [--max-ms MS] [--verbose]
+
+Exit codes:
+    0: all commands succeeded, stayed lazy (and within --max-ms if given)
+    1: a command failed, imported heavy modules or exceeded the time budget
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+# Commands that must not import axelrod or any player module
+LIGHT_COMMANDS: List[List[str]] = [
+    ["--help"],
+    ["list"],
+    ["status"],
+    ["run", "--help"],
+    ["validate", "--help"],
+    ["build-registry", "--help"],
+    ["watch", "--help"],
+    ["report", "--help"],
+    ["fingerprint", "--help"],
+    ["archive", "--help"],
+    ["serve", "--help"],
+]
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+HEAVY_PREFIXES = ("axelrod", "numpy", "tournament.players.")
+HEAVY_EXEMPT = {"tournament.players"}
+
+# Run commands from the project root so `-m tournament.cli` resolves without an install
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+@dataclass
+class StartupSample:
+    command: List[str]
+    wall_ms: float
+    import_ms: float
+    # module -> cumulative import time in microseconds
+    imports: Dict[str, int]
+    returncode: int = 0
+    # Last stderr line that is not import-time output, for failure messages
+    error: str = ""
+
+    def heavy_imports(self) -> List[str]:
+        return sorted(
+            m for m in self.imports
+            if m not in HEAVY_EXEMPT and m.startswith(HEAVY_PREFIXES)
+        )
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """Return module -> cumulative microseconds from `-X importtime` output."""
+    imports: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        m = IMPORTTIME_RE.match(line)
+        if m:
+            imports[m.group(4)] = int(m.group(2))
+    return imports
+
+
+def _top_level_total(stderr: str) -> int:
+    total = 0
+    for line in stderr.splitlines():
+        m = IMPORTTIME_RE.match(line)
+        # Top-level imports are not indented in the module column
+        if m and len(m.group(3)) <= 1:
+            total += int(m.group(2))
+    return total
+
+
+def measure(command: List[str], *, repeat: int = 3) -> StartupSample:
+    """Run `tournament <command>` in fresh interpreters; keep the fastest run.
+
+    A failing run is returned immediately so its exit code is not hidden.
+    """
+    best: StartupSample | None = None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "tournament.cli", *command],
+            capture_output=True,
+            text=True,
+            cwd=PROJECT_ROOT,
+        )
+        other = [line for line in proc.stderr.splitlines() if not IMPORTTIME_RE.match(line) and line.strip()]
+        wall_ms = (time.perf_counter() - start) * 1000
+        sample = StartupSample(
+            command=command,
+            wall_ms=wall_ms,
+            import_ms=_top_level_total(proc.stderr) / 1000,
+            imports=parse_importtime(proc.stderr),
+            returncode=proc.returncode,
+            error=other[-1] if other else "",
+        )
+        if sample.returncode != 0:
+            return sample
+        if best is None or sample.wall_ms < best.wall_ms:
+            best = sample
+    assert best is not None
+    return best
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure CLI startup time and import cost")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per command (fastest is reported)")
+    parser.add_argument("--max-ms", type=float, default=None, help="Fail if any command's wall time exceeds this")
+    parser.add_argument("--verbose", action="store_true", help="Show the slowest imports per command")
+    args = parser.parse_args(argv)
+
+    failed = False
+    print(f" {'command':34} {'wall ms':>9} {'import ms':>10}  heavy imports")
+    for command in LIGHT_COMMANDS:
+        sample = measure(command, repeat=args.repeat)
+        heavy = sample.heavy_imports()
+        label = "tournament " + " ".join(command)
+        print(f" {label:34} {sample.wall_ms:9.1f} {sample.import_ms:10.1f}  {', '.join(heavy) or '-'}")
+        if args.verbose:
+            slowest = sorted(sample.imports.items(), key=lambda kv: kv[1], reverse=True)[:5]
+            for module, us in slowest:
+                print(f"     {module:40} {us / 1000:8.1f} ms")
+        if sample.returncode != 0:
+            print(f"     exited with code {sample.returncode}: {sample.error}")
+            failed = True
+        if heavy:
+            failed = True
+        if args.max_ms is not None and sample.wall_ms > args.max_ms:
+            failed = True
+
+    if failed:
+        print("\nStartup check FAILED: command error, heavy imports or time budget exceeded.")
+        return 1
+    print("\nStartup check passed.")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main(sys.argv[1:]))
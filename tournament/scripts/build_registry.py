@@ -23,8 +23,6 @@ import sys
 from pathlib import Path
 from typing import List, Tuple, Type
 
-from axelrod import Player, Action
-
 
 def find_players(verbose: bool = False) -> List[Tuple[str, str, Type]]:
     """Return a list of (module_name, class_name, class_obj) for Player subclasses.
@@ -34,6 +32,9 @@ def find_players(verbose: bool = False) -> List[Tuple[str, str, Type]]:
     """
     players: List[Tuple[str, str, Type]] = []
 
+    # Deferred so `--help` does not pay for importing axelrod
+    from axelrod import Player
+
     try:
         pkg = importlib.import_module("tournament.players")
     except Exception as e:  # pragma: no cover
@@ -0,0 +1,317 @@
+"""Warm local server that scores a candidate player against the registered field.
+
+The server imports the registered players once, plays the baseline round robin
+once, and keeps the pairwise results plus a pool of warm worker processes. A
+request carries a candidate's source code; only the candidate's n matches are
+played (split across the workers) and the hypothetical ranking is returned.
+A candidate with the same class name as a registered player replaces it.
+
+The server executes submitted code, so it binds to 127.0.0.1 by default and is
+meant for local use by instructors and students. Candidate code only runs in
+the worker processes; an evaluation that exceeds `--timeout` gets an error
+reply and the workers are replaced.
+
+Usage:
+    python -m tournament.scripts.eval_server [--host H] [--port P] [--turns N] [--seed S] [--workers W]
+        [--timeout SECONDS]
+
+Endpoints:
+    GET  /status    -> {"players": n, "turns": ..., "seed": ...}
+    POST /evaluate  {"source": "...", "class_name": optional} -> ranking JSON
+
+Client (e.g. from a notebook):
+    from tournament.scripts.eval_server import evaluate_candidate
+    evaluate_candidate(source)     # the class source string (or a class defined in a .py file)
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import inspect
+import json
+import multiprocessing
+import os
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_URL = "http://127.0.0.1:8765"
+
+# Worker-process state: registered player classes by name
+_FIELD: Dict[str, type] = {}
+
+
+def _init_worker() -> None:
+    from tournament.players._registry import get_registered_players
+
+    _FIELD.update({cls.__name__: cls for cls in get_registered_players()})
+
+
+def _init_noop(_: int) -> int:
+    return len(_FIELD)
+
+
+def load_candidate(source: str, class_name: Optional[str] = None) -> type:
+    """Execute candidate source and return its `axelrod.Player` subclass.
+
+    `Player`, `Action` and `axelrod` are pre-imported for convenience. Without
+    `class_name` the source must define exactly one Player subclass.
+    """
+    import axelrod
+
+    namespace: dict = {
+        "__name__": "candidate",
+        "axelrod": axelrod,
+        "Player": axelrod.Player,
+        "Action": axelrod.Action,
+    }
+    exec(compile(source, "<candidate>", "exec"), namespace)
+    classes = [
+        obj for obj in namespace.values()
+        if isinstance(obj, type) and issubclass(obj, axelrod.Player)
+        and obj is not axelrod.Player and obj.__module__ == "candidate"
+    ]
+    if class_name is not None:
+        classes = [cls for cls in classes if cls.__name__ == class_name]
+    if len(classes) != 1:
+        found = ", ".join(cls.__name__ for cls in classes) or "none"
+        raise ValueError(f"Expected exactly one Player subclass in source, found: {found}")
+    return classes[0]
+
+
+def _play_chunk(
+    source: str, class_name: Optional[str], opponents: List[str], turns: int, seed: Optional[int]
+) -> List[Tuple[str, int, int]]:
+    """Worker task: play the candidate against the named opponents."""
+    from tournament.engine.referee import play_match
+
+    cls = load_candidate(source, class_name)
+    return [(name, *play_match(cls, _FIELD[name], turns=turns, seed=seed)) for name in opponents]
+
+
+def _inspect_candidate(source: str, class_name: Optional[str]) -> Tuple[str, List[str]]:
+    """Worker task: load the candidate and return (class name, validation errors)."""
+    from tournament.engine.validation import validate_player_class
+
+    cls = load_candidate(source, class_name)
+    return cls.__name__, validate_player_class(cls)
+
+
+def _guarded(task, *args) -> Tuple[bool, object]:
+    """Run a worker task, turning anything it raises (even SystemExit) into an error result."""
+    try:
+        return True, task(*args)
+    except BaseException as e:
+        return False, f"{type(e).__name__}: {e}"
+
+
+class Evaluator:
+    """Holds the warm field, baseline pairwise results and the worker pool."""
+
+    def __init__(
+        self,
+        *,
+        turns: int = 200,
+        seed: Optional[int] = None,
+        workers: Optional[int] = None,
+        timeout: float = 30.0,
+    ) -> None:
+        from tournament.engine.tournament import run_round_robin
+        from tournament.players._registry import get_registered_players
+
+        self.turns = turns
+        self.seed = seed
+        self.players = get_registered_players()
+        self.names = [cls.__name__ for cls in self.players]
+        baseline = run_round_robin(self.players, turns=turns, seed=seed)
+        self.totals: Dict[str, int] = dict(baseline.totals)
+        # (a, b) -> (score_a, score_b), stored in both orientations
+        self.pairwise: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        for m in baseline.matches:
+            self.pairwise[(m.a, m.b)] = (m.score_a, m.score_b)
+            self.pairwise[(m.b, m.a)] = (m.score_b, m.score_a)
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self._start_pool()
+        self._cache: Dict[str, dict] = {}
+
+    def _start_pool(self) -> None:
+        self.pool = multiprocessing.Pool(processes=self.workers, initializer=_init_worker)
+        # Warm every worker up front so the first request does not pay imports
+        self.pool.map(_init_noop, range(self.workers), chunksize=1)
+
+    def _restart_pool(self) -> None:
+        """Kill the workers (e.g. one stuck in a candidate's endless loop) and start fresh ones."""
+        self.pool.terminate()
+        self.pool.join()
+        self._start_pool()
+
+    def close(self) -> None:
+        self.pool.terminate()
+        self.pool.join()
+
+    def _get(self, task, deadline: float):
+        """Wait for a guarded worker task until `deadline`; raise on errors and timeouts."""
+        try:
+            ok, value = task.get(timeout=max(0.0, deadline - time.monotonic()))
+        except multiprocessing.TimeoutError:
+            # Also covers a worker that died mid-task: its result never arrives
+            self._restart_pool()
+            raise TimeoutError(f"Evaluation timed out after {self.timeout:g}s") from None
+        if not ok:
+            raise ValueError(value)
+        return value
+
+    def evaluate(self, source: str, class_name: Optional[str] = None) -> dict:
+        key = hashlib.sha256(f"{class_name}\0{source}".encode("utf-8")).hexdigest()
+        if key in self._cache:
+            return dict(self._cache[key], cached=True)
+
+        start = time.perf_counter()
+        deadline = time.monotonic() + self.timeout
+        # Candidate code only ever runs in the workers, never in the server process
+        name, errors = self._get(
+            self.pool.apply_async(_guarded, (_inspect_candidate, source, class_name)), deadline
+        )
+        opponents = [n for n in self.names if n != name]
+
+        chunk = max(1, -(-len(opponents) // self.workers))
+        tasks = [
+            self.pool.apply_async(
+                _guarded, (_play_chunk, source, class_name, opponents[i:i + chunk], self.turns, self.seed)
+            )
+            for i in range(0, len(opponents), chunk)
+        ]
+        matches = [row for task in tasks for row in self._get(task, deadline)]
+
+        totals = {n: self.totals[n] for n in opponents}
+        if name in self.totals:
+            # Candidate replaces a registered player of the same name
+            for opp in opponents:
+                totals[opp] -= self.pairwise[(opp, name)][0]
+        totals[name] = 0
+        for opp, score_c, score_o in matches:
+            totals[name] += score_c
+            totals[opp] += score_o
+
+        ranking = sorted(totals.items(), key=lambda kv: kv[1], reverse=True)
+        rank = next(i for i, (n, _) in enumerate(ranking, start=1) if n == name)
+        result = {
+            "player": name,
+            "rank": rank,
+            "of": len(ranking),
+            "total": totals[name],
+            "errors": errors,
+            "ranking": ranking,
+            "matches": matches,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+            "cached": False,
+        }
+        self._cache[key] = result
+        return result
+
+
+def make_handler(evaluator: Evaluator) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status: int, payload: dict) -> None:
+            try:
+                body = json.dumps(payload).encode("utf-8")
+            except (TypeError, ValueError) as e:
+                # Reply with an error rather than dropping the connection
+                status = 500
+                body = json.dumps({"error": f"Could not encode the response: {e}"}).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:  # noqa: N802 - http.server API
+            if self.path != "/status":
+                self._send(404, {"error": f"Unknown path {self.path}"})
+                return
+            self._send(200, {"players": len(evaluator.names), "turns": evaluator.turns, "seed": evaluator.seed})
+
+        def do_POST(self) -> None:  # noqa: N802 - http.server API
+            if self.path != "/evaluate":
+                self._send(404, {"error": f"Unknown path {self.path}"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length", "0"))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                result = evaluator.evaluate(request["source"], request.get("class_name"))
+            except BaseException as e:
+                # Candidate errors must never stop the server
+                if isinstance(e, KeyboardInterrupt):
+                    raise
+                self._send(400, {"error": f"{type(e).__name__}: {e}"})
+                return
+            self._send(200, result)
+
+    return Handler
+
+
+def evaluate_candidate(
+    candidate: "str | type",
+    *,
+    url: str = DEFAULT_URL,
+    class_name: Optional[str] = None,
+    timeout: float = 60.0,
+) -> dict:
+    """Ask a running evaluation server how `candidate` would rank.
+
+    `candidate` is the source code of a Player class, or the class itself (its
+    source is read with `inspect.getsource`). In notebooks, `getsource` often
+    cannot find a class's source, so pass the source string there. Raises
+    RuntimeError with the server's message if evaluation fails.
+    """
+    if isinstance(candidate, type):
+        class_name = class_name or candidate.__name__
+        try:
+            candidate = inspect.getsource(candidate)
+        except (TypeError, OSError):
+            raise TypeError(
+                f"Could not read the source of {candidate.__name__} (common for classes defined in a "
+                "notebook). Pass the class source code as a string instead."
+            ) from None
+    payload = json.dumps({"source": candidate, "class_name": class_name}).encode("utf-8")
+    req = urllib.request.Request(
+        url.rstrip("/") + "/evaluate", data=payload, headers={"Content-Type": "application/json"}
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        raise RuntimeError(json.loads(e.read()).get("error", str(e))) from None
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve candidate evaluations against the registered field")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to bind")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    parser.add_argument("--turns", type=int, default=200, help="Number of turns per match")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducibility")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for candidate matches")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Seconds allowed per evaluation")
+    args = parser.parse_args(argv)
+
+    print("Warming up: importing players and playing the baseline round robin...")
+    evaluator = Evaluator(turns=args.turns, seed=args.seed, workers=args.workers, timeout=args.timeout)
+    server = HTTPServer((args.host, args.port), make_handler(evaluator))
+    print(f"Serving {len(evaluator.names)} players on http://{args.host}:{args.port} "
+          f"with {evaluator.workers} workers")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping server.")
+    finally:
+        server.server_close()
+        evaluator.close()
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    import sys
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,53 @@
+"""Report clusters of behaviourally identical registered players.
+
+Usage:
+    python -m tournament.scripts.fingerprint_players [--turns N] [--verbose]
+
+Exit codes:
+    0: no duplicates found
+    1: at least one cluster of duplicate players found
+"""
+from __future__ import annotations
+
+import argparse
+from typing import List
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Fingerprint registered players and report duplicates")
+    parser.add_argument("--turns", type=int, default=200, help="Number of turns per probe match")
+    parser.add_argument("--verbose", action="store_true", help="Print every player's fingerprint")
+    args = parser.parse_args(argv)
+
+    # Deferred: these pull in axelrod and every registered player module
+    from tournament.engine.fingerprint import fingerprint_players
+    from tournament.players._registry import get_registered_players
+
+    players = get_registered_players()
+    print(f"Fingerprinting {len(players)} players...")
+    report = fingerprint_players(players, turns=args.turns)
+
+    if args.verbose:
+        print("\nFingerprints:")
+        for name in report.players:
+            print(f" - {name}: {report.fingerprints[name][:12]}")
+
+    if report.stochastic:
+        print("\nStochastic (never grouped):")
+        for name in report.stochastic:
+            print(f" - {name}")
+
+    clusters = report.clusters()
+    if not clusters:
+        print("\nNo duplicate players found.")
+        return 0
+
+    print("\nDuplicate clusters:")
+    for i, members in enumerate(clusters, start=1):
+        print(f" {i:>2}. {', '.join(members)}")
+    return 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    import sys
+    raise SystemExit(main(sys.argv[1:]))
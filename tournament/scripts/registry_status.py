@@ -0,0 +1,135 @@
+"""List registered players and report registry freshness without importing them.
+
+Reads `tournament/players/_registry.py` as source (via `ast`) instead of
+importing it, so neither `axelrod` nor any student module is loaded.
+
+Usage:
+    python -m tournament.scripts.registry_status list
+    python -m tournament.scripts.registry_status status
+
+Exit codes:
+    0: success (for `status`: registry is up to date)
+    1: `status` found player files missing from the registry, or vice versa
+    2: registry could not be read
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import datetime as _dt
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from tournament.players import __path__ as players_pkg_paths  # type: ignore
+
+GENERATED_AT_RE = re.compile(r"^# Generated at: (\S+)", re.MULTILINE)
+
+
+@dataclass
+class RegistryMetadata:
+    path: Path
+    generated_at: Optional[_dt.datetime]
+    # (module stem, class name) in registry order
+    entries: List[Tuple[str, str]]
+
+
+def players_dir() -> Path:
+    return Path(list(players_pkg_paths)[0])
+
+
+def read_registry_metadata(path: Path | None = None) -> RegistryMetadata:
+    """Parse the generated registry source for its imports and timestamp."""
+    path = path or players_dir() / "_registry.py"
+    source = path.read_text(encoding="utf-8")
+    tree = ast.parse(source, filename=str(path))
+
+    class_module: dict[str, str] = {}
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.level == 1 and node.module:
+            for alias in node.names:
+                class_module[alias.asname or alias.name] = node.module
+
+    # Keep the REGISTERED_PLAYERS order when it can be found
+    order: List[str] = list(class_module)
+    for node in tree.body:
+        if isinstance(node, ast.AnnAssign):
+            targets = [node.target]
+        elif isinstance(node, ast.Assign):
+            targets = node.targets
+        else:
+            continue
+        is_registry = any(isinstance(t, ast.Name) and t.id == "REGISTERED_PLAYERS" for t in targets)
+        if is_registry and isinstance(node.value, ast.List):
+            order = [elt.id for elt in node.value.elts if isinstance(elt, ast.Name)]
+
+    generated_at = None
+    m = GENERATED_AT_RE.search(source)
+    if m:
+        try:
+            generated_at = _dt.datetime.fromisoformat(m.group(1))
+        except ValueError:
+            generated_at = None
+
+    entries = [(class_module[name], name) for name in order if name in class_module]
+    return RegistryMetadata(path=path, generated_at=generated_at, entries=entries)
+
+
+def player_files(dir_path: Path) -> List[Path]:
+    """Return candidate player modules, mirroring build_registry's scan rules."""
+    return [p for p in sorted(dir_path.glob("*.py")) if not p.name.startswith("_")]
+
+
+def _list(meta: RegistryMetadata) -> int:
+    for module, cls_name in meta.entries:
+        print(f"tournament.players.{module}:{cls_name}")
+    return 0
+
+
+def _status(meta: RegistryMetadata) -> int:
+    when = meta.generated_at.isoformat() if meta.generated_at else "unknown"
+    print(f"Registry: {meta.path}")
+    print(f"Generated at: {when}")
+    print(f"Registered players: {len(meta.entries)}")
+
+    registered_modules = {module for module, _ in meta.entries}
+    on_disk = {p.stem for p in player_files(meta.path.parent)}
+
+    unregistered = sorted(on_disk - registered_modules)
+    missing = sorted(registered_modules - on_disk)
+
+    if unregistered:
+        print("\nPlayer files not in registry:")
+        for stem in unregistered:
+            print(f" - {stem}.py")
+    if missing:
+        print("\nRegistered modules with no file:")
+        for stem in missing:
+            print(f" - {stem}.py")
+    if unregistered or missing:
+        print("\nRun `tournament build-registry` to refresh.")
+        return 1
+    print("\nRegistry is up to date.")
+    return 0
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Inspect the players registry without importing players")
+    parser.add_argument("action", choices=["list", "status"], help="What to show")
+    args = parser.parse_args(argv)
+
+    try:
+        meta = read_registry_metadata()
+    except (OSError, SyntaxError) as e:
+        print(f"Unable to read registry: {e}")
+        return 2
+
+    if args.action == "list":
+        return _list(meta)
+    return _status(meta)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    import sys
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,82 @@
+"""Generate reports from a results store written by `run_tournament --store`.
+
+Reports read only the store's aggregate index, never the raw match records.
+
+Usage:
+    python -m tournament.scripts.report DIR runs
+    python -m tournament.scripts.report DIR leaderboard [--run ID] [--html] [--out FILE]
+    python -m tournament.scripts.report DIR diff [--from ID] [--to ID] [--html] [--out FILE]
+    python -m tournament.scripts.report DIR standings [--series NAME] [--html] [--out FILE]
+    python -m tournament.scripts.report DIR h2h PLAYER [--series NAME] [--html] [--out FILE]
+    python -m tournament.scripts.report DIR history PLAYER [--html] [--out FILE]
+
+Exit codes:
+    0: success
+    1: requested run or player not found
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import List
+
+from tournament.engine import results
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate reports from stored tournament results")
+    parser.add_argument("directory", help="Results store directory")
+    sub = parser.add_subparsers(dest="action", required=True)
+    sub.add_parser("runs", help="List stored runs")
+    board = sub.add_parser("leaderboard", help="Ranking of a run with rank changes")
+    board.add_argument("--run", default=None, help="Run id (default: latest)")
+    changes = sub.add_parser("diff", help="Rank and total changes between two runs")
+    changes.add_argument("--from", dest="run_a", default=None, help="Older run id (default: previous run of the same series)")
+    changes.add_argument("--to", dest="run_b", default=None, help="Newer run id (default: latest)")
+    table = sub.add_parser("standings", help="Mean totals across runs of one series")
+    table.add_argument("--series", default=None, help="Series name (default: latest run's series)")
+    h2h = sub.add_parser("h2h", help="Per-opponent breakdown for one player")
+    h2h.add_argument("player", help="Player class name")
+    h2h.add_argument("--series", default=None, help="Series name (default: latest run's series)")
+    hist = sub.add_parser("history", help="Rank and total of one player across runs")
+    hist.add_argument("player", help="Player class name")
+    for p in (board, changes, table, h2h, hist):
+        p.add_argument("--html", action="store_true", help="Emit an HTML table instead of Markdown")
+        p.add_argument("--out", default=None, help="Write the report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    store = results.ResultStore(args.directory)
+    if args.action == "runs":
+        for run in store.index["runs"]:
+            seed = run["params"].get("seed")
+            print(f" {run['id']:20} {len(run['ranking']):>4} players  {run['matches']:>6} matches  "
+                  f"{run['series']}" + (f", seed={seed}" if seed is not None else ""))
+        return 0
+
+    fmt = "html" if args.html else "md"
+    try:
+        if args.action == "leaderboard":
+            text = results.leaderboard(store, args.run, fmt=fmt)
+        elif args.action == "diff":
+            text = results.diff(store, args.run_a, args.run_b, fmt=fmt)
+        elif args.action == "standings":
+            text = results.standings(store, args.series, fmt=fmt)
+        elif args.action == "h2h":
+            text = results.head_to_head(store, args.player, args.series, fmt=fmt)
+        else:
+            text = results.history(store, args.player, fmt=fmt)
+    except KeyError as e:
+        print(e.args[0] if e.args else e)
+        return 1
+
+    if args.out:
+        Path(args.out).write_text(text, encoding="utf-8")
+        print(f"Wrote {args.out}")
+    else:
+        print(text, end="")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    import sys
+    raise SystemExit(main(sys.argv[1:]))
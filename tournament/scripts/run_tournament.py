@@ -1,27 +1,111 @@
-"""Run a round-robin tournament among registered players.
+"""Run a tournament among registered players.
 
 Usage:
-    python -m tournament.scripts.run_tournament [--turns N] [--seed S]
+    python -m tournament.scripts.run_tournament [--turns N] [--seed S] [--dedupe]
+        [--format {round-robin,swiss,sampled,groups,adaptive}] [--rounds R] [--k K]
+        [--group-size G] [--advance A] [--estimate-accuracy]
+        [--confidence C] [--initial-reps N] [--max-reps N] [--budget MATCHES]
+        [--archive DIR] [--store DIR]
 """
 from __future__ import annotations
 
 import argparse
 from typing import List
 
-from tournament.engine.tournament import run_round_robin
-from tournament.players._registry import get_registered_players
+FORMATS = ["round-robin", "swiss", "sampled", "groups", "adaptive"]
+
+# Format options that change what a run measures, so stored runs differing in
+# them belong to different series (dedupe and the adaptive options only change
+# cost or precision)
+SERIES_OPTIONS = ("rounds", "k", "group_size", "advance")
 
 
 def main(argv: List[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Run a round-robin tournament")
     parser.add_argument("--turns", type=int, default=200, help="Number of turns per match")
     parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducibility")
+    parser.add_argument("--dedupe", action="store_true", help="Share results between behaviourally identical players")
+    parser.add_argument("--format", choices=FORMATS, default="round-robin", help="Tournament format")
+    parser.add_argument("--rounds", type=int, default=None, help="Swiss: number of rounds (default ceil(log2 n) + 1)")
+    parser.add_argument("--k", type=int, default=10, help="Sampled: opponents per player")
+    parser.add_argument("--group-size", type=int, default=8, help="Groups: players per group")
+    parser.add_argument("--advance", type=int, default=2, help="Groups: players advancing from each group")
+    parser.add_argument("--estimate-accuracy", action="store_true",
+                        help="Estimate rank correlation with the full round robin on random subsets")
+    parser.add_argument("--confidence", type=float, default=0.95, help="Adaptive: target confidence per adjacent rank")
+    parser.add_argument("--initial-reps", type=int, default=3, help="Adaptive: repetitions every pairing starts with")
+    parser.add_argument("--max-reps", type=int, default=50, help="Adaptive: repetition cap per pairing")
+    parser.add_argument("--budget", type=int, default=None, help="Adaptive: maximum total matches to simulate")
+    parser.add_argument("--archive", default=None,
+                        help="Store every match's moves in this archive directory (round-robin and adaptive)")
+    parser.add_argument("--store", default=None,
+                        help="Add this run to a results store directory (see `tournament report`)")
     args = parser.parse_args(argv)
+    if args.archive and args.format not in ("round-robin", "adaptive"):
+        parser.error("--archive is only supported with --format round-robin or adaptive")
+
+    # Deferred: these pull in axelrod and every registered player module
+    from tournament.engine import adaptive, formats
+    from tournament.engine.archive import MoveArchive, MoveArchiveWriter
+    from tournament.engine.results import ResultStore
+    from tournament.engine.tournament import run_round_robin
+    from tournament.players._registry import get_registered_players
 
     players = get_registered_players()
-    print(f"Running tournament for {len(players)} players...")
+    print(f"Running {args.format} tournament for {len(players)} players...")
+
+    if args.format == "round-robin":
+        run_format, options = run_round_robin, {"dedupe": args.dedupe}
+    elif args.format == "swiss":
+        run_format, options = formats.run_swiss, {"rounds": args.rounds}
+    elif args.format == "sampled":
+        run_format, options = formats.run_sampled_round_robin, {"k": args.k}
+    elif args.format == "groups":
+        run_format, options = formats.run_group_stage, {"group_size": args.group_size, "advance": args.advance}
+    else:
+        run_format, options = adaptive.run_adaptive_round_robin, {
+            "confidence": args.confidence,
+            "initial_repetitions": args.initial_reps,
+            "max_repetitions": args.max_reps,
+            "budget": args.budget,
+        }
+
+    archived_keys = []
+    try:
+        if args.archive:
+            with MoveArchiveWriter(args.archive) as archive:
+                result = run_format(players, turns=args.turns, seed=args.seed, archive=archive, **options)
+                archived_keys = archive.written_keys()
+            print(f"\nMoves archived to {args.archive}")
+        else:
+            result = run_format(players, turns=args.turns, seed=args.seed, **options)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 2
 
-    result = run_round_robin(players, turns=args.turns, seed=args.seed)
+    if result.probe_matches:
+        if result.duplicates:
+            print("\nDuplicate clusters (results shared):")
+            for members in result.duplicates:
+                print(f" - {', '.join(members)}")
+        else:
+            print("\nNo duplicate players found.")
+        played = result.simulated + result.probe_matches
+        print(
+            f"Simulated {result.simulated} of {len(result.matches)} matches plus "
+            f"{result.probe_matches} fingerprint probe matches ({played} in total)."
+        )
+        if played >= len(result.matches):
+            print("Fingerprinting cost more than it saved; a plain round robin is cheaper for this field.")
+
+    if isinstance(result, adaptive.AdaptiveResult):
+        print(f"\nSimulated {result.simulated} matches ({result.saved} fewer than {args.max_reps} repetitions each).")
+        print(f"Stopped: {result.stop_reason}.")
+        if result.adjacent_confidence:
+            print(f"Lowest adjacent-rank confidence: {min(result.adjacent_confidence):.3f}")
+        print("Match scores below are means over repetitions.")
+    elif args.format != "round-robin":
+        print(f"\nPlayed {len(result.matches)} matches; totals are scaled to the full round robin.")
 
     print("\nTotals:")
     for name, total in result.totals.items():
@@ -35,6 +119,33 @@ def main(argv: List[str] | None = None) -> int:
     for m in result.matches:
         print(f" {m.a} vs {m.b}: {m.score_a} - {m.score_b}")
 
+    if args.estimate_accuracy and args.format not in ("round-robin", "adaptive"):
+        subset_size = 24
+        scaled = formats.scale_format_options(options, len(players), subset_size)
+        agreement = formats.estimate_rank_correlation(
+            run_format, players, subset_size=subset_size, turns=args.turns, seed=args.seed, **scaled
+        )
+        print(
+            f"\nRank correlation with full round robin ({agreement.subset_size}-player subsets): "
+            f"mean {agreement.mean:.3f}, min {agreement.minimum:.3f}"
+        )
+        changed = ", ".join(f"{k}={v}" for k, v in scaled.items() if v is not None and v != options.get(k))
+        if changed:
+            print(f"Options adapted to the subset size: {changed}")
+        if args.format == "groups":
+            print("Groups keep their size on subsets, so each subset has fewer groups than the full field.")
+
+    if args.store:
+        cooperation = None
+        if args.archive:
+            with MoveArchive(args.archive) as archive:
+                # Only this run's matches; the archive directory may hold earlier runs
+                cooperation = archive.cooperation_rates(archived_keys)
+        params = {"format": args.format, "turns": args.turns, "seed": args.seed, "players": len(players)}
+        params.update((k, v) for k, v in options.items() if k in SERIES_OPTIONS)
+        run_id = ResultStore(args.store).add_run(result, params=params, cooperation=cooperation)
+        print(f"\nStored as run {run_id} in {args.store}")
+
     return 0
 
 
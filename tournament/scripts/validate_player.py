@@ -8,13 +8,11 @@ Otherwise, validates all registered players from `tournament.players._registry`.
 """
 from __future__ import annotations
 
+import argparse
 import importlib
 import sys
 from typing import List, Type
 
-from tournament.engine.validation import validate_player_class, validate_registered_players
-from tournament.players._registry import get_registered_players
-
 
 def _import_target(spec: str) -> Type:
     """Import a class from a spec like 'module.submodule:ClassName'."""
@@ -29,10 +27,16 @@ def _import_target(spec: str) -> Type:
 
 
 def main(argv: List[str] | None = None) -> int:
-    argv = list(sys.argv[1:] if argv is None else argv)
-    if argv:
+    parser = argparse.ArgumentParser(description="Validate one player class or all registered players")
+    parser.add_argument("target", nargs="?", default=None, help="Class to validate as 'module.path:ClassName'")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    # Deferred: validation imports axelrod
+    from tournament.engine.validation import validate_player_class, validate_registered_players
+
+    if args.target:
         try:
-            target = _import_target(argv[0])
+            target = _import_target(args.target)
         except Exception as e:
             print(f"Error importing target: {e}")
             return 2
@@ -45,7 +49,9 @@ def main(argv: List[str] | None = None) -> int:
         print("Validation passed for:", target.__name__)
         return 0
 
-    # No argument: validate registry
+    # No argument: validate registry (imports every registered player module)
+    from tournament.players._registry import get_registered_players
+
     players = get_registered_players()
     messages = validate_registered_players(players)
     if messages: